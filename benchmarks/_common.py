@@ -0,0 +1,26 @@
+"""Helpers shared by the benchmark scripts."""
+from typing import Callable
+from pathlib import Path
+import timeit
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from funpay.enums import HtmlBackend
+
+
+def best_of(func: Callable[[], object], repeat: int) -> float:
+    """Returns the fastest of ``repeat`` single runs of ``func`` in seconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def available_backends() -> list['HtmlBackend']:
+    """Returns html.parser and, if lxml is installed, lxml."""
+    backends = [HtmlBackend.HTML_PARSER]
+
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return backends
+
+    return backends + [HtmlBackend.LXML]
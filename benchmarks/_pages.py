@@ -0,0 +1,56 @@
+"""Synthetic FunPay pages used by the benchmark and equivalence scripts."""
+
+
+OFFER = """<div class="offer"><div class="offer-list-title-container"><a href="https://funpay.com/lots/{node}/">Node {node}</a></div>
+<a class="tc-item" href="https://funpay.com/lots/offer?id={id}"><div class="tc-desc-text">Offer {id}</div>
+<div class="tc-amount">3</div><div class="tc-price" data-s="10.5"></div></a></div>"""
+
+ORDER = """<a href="https://funpay.com/orders/C{id:07d}/" class="tc-item info"><div class="tc-date"><div class="tc-date-time">12 мая, 14:05</div></div>
+<div class="tc-order">#C{id:07d}</div><div class="order-desc"><div>Item {id}</div><div class="text-muted">Node</div></div>
+<div class="tc-user"><div class="media media-user"><div class="media-body"><div class="media-user-name">
+<span class="pseudo-a" data-href="https://funpay.com/users/{id}/">user{id}</span></div></div></div></div>
+<div class="tc-status text-primary">Оплачен</div><div class="tc-price">{id}.5 <span class="unit">₽</span></div></a>"""
+
+
+def profile_page(offers: int) -> str:
+    return "<html><body>" + "".join(OFFER.format(node=i % 20, id=i) for i in range(offers)) + "</body></html>"
+
+
+def orders_page(orders: int) -> str:
+    return '<html><body><div class="tc">' + "".join(ORDER.format(id=i) for i in range(orders)) + "</div></body></html>"
+
+
+HEAD = """<div class="media-user-name"><a href="https://funpay.com/users/{author}/">user{author}</a>
+<div class="chat-msg-date" title="{day} января 2025, 10:00:00">10:00</div></div>"""
+
+MESSAGE = """<div class="chat-msg-item chat-msg-with-head" id="message-{id}"><div class="chat-message">
+<div class="media media-user">{head}</div><div class="chat-msg-body">
+<div class="chat-msg-text">hello, message {id} with <a href="https://funpay.com/">a link</a></div></div></div></div>"""
+
+
+def chat_history(messages: int) -> dict:
+    """Builds a response where every 4th message starts a new author block."""
+    raw_messages = [
+        {
+            "id": i,
+            "html": MESSAGE.format(id=i, head=HEAD.format(author=i % 7, day=i % 28 + 1) if i % 4 == 1 else "")
+        }
+        for i in range(1, messages + 1)
+    ]
+
+    return {"node": {"id": 7, "name": "users-5-6"}, "messages": raw_messages}
+
+
+CONTACT = """<a href="https://funpay.com/chat/?node={id}" class="contact-item{unread}" data-id="{id}" data-node-msg="{last}">
+<div class="contact-item-photo"><div class="avatar-photo" data-href="https://funpay.com/users/{user}/"></div></div>
+<div class="media-user-name">user{user}</div><div class="contact-item-message">last message {last}</div></a>"""
+
+
+def chat_list_page(chats: int) -> str:
+    """Builds a /chat/ page where every 3rd chat is unread."""
+    contacts = "".join(
+        CONTACT.format(id=i, user=i + 100, last=i * 10, unread=" unread" if i % 3 == 0 else "")
+        for i in range(1, chats + 1)
+    )
+
+    return f'<html><body><div class="contact-list">{contacts}</div></body></html>'
@@ -0,0 +1,66 @@
+"""Times ChatJsonParser on a 1k-message /chat/history response.
+
+"batched" is the current parser, which builds one tree for all messages;
+"per message" builds a tree for every message, as the parser did before.
+Both must return identical messages.
+
+Usage:
+    python benchmarks/chat_parse.py [--messages 1000] [--repeat 5]
+"""
+import argparse
+import sys
+
+from _common import best_of, available_backends
+from _pages import chat_history
+from funpay.enums import HtmlBackend, Locale
+from funpay.parsers.html import MessageHtmlParser
+from funpay.parsers.json import ChatJsonParser
+
+
+def parse_per_message(data: dict, backend: 'HtmlBackend') -> list:
+    author, date = None, None
+    messages = []
+
+    for raw_message in data["messages"]:
+        message = MessageHtmlParser(raw_message["html"], backend=backend).parse(
+            chat_id=data["node"]["id"],
+            locale=Locale.RU,
+            author=author,
+            date=date
+        )
+
+        if message:
+            author, date = message.author, message.date
+            messages.append(message)
+
+    return messages
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=1000, help="Messages in the response")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (the best is reported)")
+    args = parser.parse_args()
+
+    data = chat_history(args.messages)
+
+    for backend in available_backends():
+        def batched() -> list:
+            return ChatJsonParser(data, backend=backend).parse(locale=Locale.RU).messages
+
+        def per_message() -> list:
+            return parse_per_message(data, backend)
+
+        assert batched() == per_message(), f"{backend.value}: results differ"
+
+        batched_time = best_of(batched, args.repeat)
+        per_message_time = best_of(per_message, args.repeat)
+
+        print(f"{backend.value:11} {args.messages} messages   batched {batched_time * 1000:8.1f} ms   "
+              f"per message {per_message_time * 1000:8.1f} ms   x{per_message_time / batched_time:.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Checks that ``import funpay`` stays within its startup budget.
+
+Runs ``python -X importtime -c "import funpay"`` in fresh interpreters, takes
+the median cumulative time of the ``funpay`` package and fails when it is over
+the budget or when one of the heavy dependencies is imported eagerly.
+
+Usage:
+    python benchmarks/import_time.py [--budget 0.1] [--runs 7]
+"""
+from pathlib import Path
+import subprocess
+import statistics
+import argparse
+import sys
+import os
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ("aiohttp", "bs4", "lxml", "fake_useragent", "aiocache")
+
+
+def measure() -> tuple[float, set[str]]:
+    """Returns the cumulative import time of ``funpay`` (seconds) and the imported top-level modules."""
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import funpay"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True
+    )
+
+    modules = set()
+    cumulative = None
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+
+        if not cumulative_us.isdigit():
+            continue
+
+        modules.add(name.split(".")[0])
+
+        if name == "funpay":
+            cumulative = int(cumulative_us) / 1_000_000
+
+    if cumulative is None:
+        raise RuntimeError("funpay was not found in the -X importtime output")
+
+    return cumulative, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=0.1, help="Maximum median import time in seconds")
+    parser.add_argument("--runs", type=int, default=7, help="Number of fresh interpreters to measure")
+    args = parser.parse_args()
+
+    timings = []
+    imported = set()
+
+    for _ in range(args.runs):
+        cumulative, modules = measure()
+        timings.append(cumulative)
+        imported |= modules
+
+    median = statistics.median(timings)
+    eager = sorted(imported.intersection(HEAVY_MODULES))
+
+    print(f"import funpay: median {median * 1000:.1f} ms, max {max(timings) * 1000:.1f} ms "
+          f"(budget {args.budget * 1000:.0f} ms, {args.runs} runs)")
+
+    if eager:
+        print(f"FAIL: imported eagerly: {', '.join(eager)}")
+
+    if median > args.budget:
+        print("FAIL: over budget")
+
+    return 1 if eager or median > args.budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""Checks that every parser gives the same result with the html.parser and lxml backends.
+
+Saved pages are picked from a directory by their file name prefix:
+
+    main*.html             main page (account, games)
+    user_<id>*.html        user profile (user, lots, reviews)
+    order_*.html           order page
+    sales*.html            sales list
+    purchases*.html        purchases list
+    chat_history*.json     response of /chat/history
+    chat*.html             chat list page
+
+Without a directory the parsers run on the synthetic pages from ``_pages``
+(profile, sales, purchases, chat history and chat list).
+
+Usage:
+    python benchmarks/parser_equivalence.py [PAGES_DIR] [--locale ru]
+"""
+from typing import Any, Callable
+from pathlib import Path
+import argparse
+import json
+import sys
+
+import _common  # noqa: F401
+from _pages import profile_page, orders_page, chat_history, chat_list_page
+from funpay.enums import HtmlBackend, Locale, OrderType
+from funpay.parsers.html import (
+    FunpayAccountHtmlParser,
+    FunpayGamesHtmlParser,
+    FunpayUserProfileHtmlParser,
+    FunpayUserLotsHtmlParser,
+    FunpayUserReviewsHtmlParser,
+    FunpayOrderHtmlParser,
+    FunpayOrdersCutHtmlParser,
+    FunpayChatBookmarksHtmlParser,
+    FunpayChatCutsHtmlParser
+)
+from funpay.parsers.json import ChatJsonParser
+
+
+def _user_id(path: Path) -> int:
+    return int(path.stem.split("_")[1])
+
+
+# File name prefix -> parsers with a function building their parse() kwargs
+PAGES: list[tuple[str, list[tuple[type, Callable[[Path, 'Locale'], dict]]]]] = [
+    ("main", [
+        (FunpayAccountHtmlParser, lambda path, locale: {}),
+        (FunpayGamesHtmlParser, lambda path, locale: {})
+    ]),
+    ("user_", [
+        (FunpayUserProfileHtmlParser, lambda path, locale: {"locale": locale, "user_id": _user_id(path)}),
+        (FunpayUserLotsHtmlParser, lambda path, locale: {}),
+        (FunpayUserReviewsHtmlParser, lambda path, locale: {})
+    ]),
+    ("order_", [
+        (FunpayOrderHtmlParser, lambda path, locale: {"locale": locale})
+    ]),
+    ("sales", [
+        (FunpayOrdersCutHtmlParser, lambda path, locale: {"locale": locale, "order_type": OrderType.SALE})
+    ]),
+    ("purchases", [
+        (FunpayOrdersCutHtmlParser, lambda path, locale: {"locale": locale, "order_type": OrderType.PURCHASE})
+    ]),
+    ("chat_history", [
+        (ChatJsonParser, lambda path, locale: {"locale": locale})
+    ]),
+    ("chat", [
+        (FunpayChatBookmarksHtmlParser, lambda path, locale: {}),
+        (FunpayChatCutsHtmlParser, lambda path, locale: {})
+    ])
+]
+
+
+def _parsers(name: str) -> list[tuple[type, Callable[[Path, 'Locale'], dict]]]:
+    return next((parsers for prefix, parsers in PAGES if name.startswith(prefix)), [])
+
+
+# Synthetic page name -> page builder and the parsers that apply to it
+SYNTHETIC: list[tuple[str, Callable[[], Any], list[tuple[type, Callable[[Path, 'Locale'], dict]]]]] = [
+    ("profile.html", lambda: profile_page(200), [(FunpayUserLotsHtmlParser, lambda path, locale: {})]),
+    ("sales.html", lambda: orders_page(500), _parsers("sales")),
+    ("purchases.html", lambda: orders_page(500), _parsers("purchases")),
+    ("chat_history.json", lambda: chat_history(1000), _parsers("chat_history")),
+    ("chat.html", lambda: chat_list_page(100), _parsers("chat"))
+]
+
+
+class ParseFailure(str):
+    """Exception raised by a parser, as ``<ExcType: message>``."""
+
+
+def _load(path: Path) -> Any:
+    text = path.read_text(encoding="utf-8")
+    return json.loads(text) if path.suffix == ".json" else text
+
+
+def _parse(parser: type, data: Any, backend: 'HtmlBackend', kwargs: dict) -> Any:
+    try:
+        return parser(data, backend=backend).parse(**kwargs)
+    except Exception as e:
+        return ParseFailure(f"<{type(e).__name__}: {e}>")
+
+
+def compare(
+        path: Path,
+        data: Any,
+        parsers: list[tuple[type, Callable[[Path, 'Locale'], dict]]],
+        locale: 'Locale'
+) -> list[str]:
+    """Returns a description of every parser whose backends disagree on the page or fail on it."""
+    differences = []
+
+    for parser, build_kwargs in parsers:
+        kwargs = build_kwargs(path, locale)
+        expected = _parse(parser, data, HtmlBackend.HTML_PARSER, kwargs)
+        actual = _parse(parser, data, HtmlBackend.LXML, kwargs)
+        failed = isinstance(expected, ParseFailure) or isinstance(actual, ParseFailure)
+        status = "FAIL" if failed else "OK" if expected == actual else "DIFF"
+
+        print(f"{status:4} {path.name}: {parser.__name__}")
+
+        if failed or expected != actual:
+            differences.append(f"{path.name}: {parser.__name__}\n  html.parser: {expected!r}\n  lxml:        {actual!r}")
+
+    return differences
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", type=Path, nargs="?", help="Directory with saved pages (synthetic pages if omitted)")
+    parser.add_argument("--locale", default=Locale.RU.value, help="Locale of the saved pages")
+    args = parser.parse_args()
+
+    differences = []
+
+    locale = Locale(args.locale)
+
+    if args.pages is None:
+        for name, build, parsers in SYNTHETIC:
+            differences.extend(compare(Path(name), build(), parsers, locale))
+    else:
+        for path in sorted(args.pages.iterdir()):
+            if parsers := _parsers(path.name):
+                differences.extend(compare(path, _load(path), parsers, locale))
+
+    for difference in differences:
+        print(difference)
+
+    return 1 if differences else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Times the page parsers on a 200-offer profile page and a 500-row /orders/trade page.
+
+"tags" is the current parse-once path: the page is parsed a single time and
+the row parsers receive ``Tag`` nodes. "reparse" serializes every row and
+parses it again, as the row parsers did before.
+
+Usage:
+    python benchmarks/parser_speed.py [--repeat 5] [--offers 200] [--orders 500]
+"""
+import argparse
+import sys
+
+from _common import best_of, available_backends
+from _pages import profile_page, orders_page
+from funpay.enums import HtmlBackend, Locale, OrderType
+from funpay.parsers.html import (
+    FunpayUserLotsHtmlParser,
+    LotHtmlParser,
+    FunpayOrdersCutHtmlParser
+)
+from funpay.parsers.html.order_parser import OrderCutHtmlParser
+
+
+def parse_lots_reparse(html: str, backend: 'HtmlBackend') -> list:
+    offers = FunpayUserLotsHtmlParser(html, backend=backend)._extract_offer_container()
+    return [LotHtmlParser(str(offer), backend=backend).parse() for offer in offers]
+
+
+def parse_orders_reparse(html: str, backend: 'HtmlBackend') -> list:
+    rows = FunpayOrdersCutHtmlParser(html, backend=backend)._extract_orders()
+
+    return [
+        OrderCutHtmlParser(str(row), backend=backend).parse(locale=Locale.RU, order_type=OrderType.SALE)
+        for row in rows
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (the best is reported)")
+    parser.add_argument("--offers", type=int, default=200, help="Offers on the profile page")
+    parser.add_argument("--orders", type=int, default=500, help="Rows on the orders page")
+    args = parser.parse_args()
+
+    profile = profile_page(args.offers)
+    orders = orders_page(args.orders)
+
+    for backend in available_backends():
+        cases = {
+            f"profile ({args.offers} offers)": (
+                lambda: FunpayUserLotsHtmlParser(profile, backend=backend).parse(),
+                lambda: parse_lots_reparse(profile, backend)
+            ),
+            f"orders ({args.orders} rows)": (
+                lambda: FunpayOrdersCutHtmlParser(orders, backend=backend).parse(
+                    locale=Locale.RU,
+                    order_type=OrderType.SALE
+                ),
+                lambda: parse_orders_reparse(orders, backend)
+            )
+        }
+
+        for name, (tags, reparse) in cases.items():
+            assert tags() == reparse(), f"{name}: results differ"
+
+            tags_time = best_of(tags, args.repeat)
+            reparse_time = best_of(reparse, args.repeat)
+
+            print(f"{backend.value:11} {name:22} tags {tags_time * 1000:8.1f} ms   "
+                  f"reparse {reparse_time * 1000:8.1f} ms   x{reparse_time / tags_time:.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Compares the memory of 1M orders/messages kept as dataclass lists and as OrderTable/MessageTable.
+
+Memory is the size traced by ``tracemalloc`` after the collection is built.
+
+Usage:
+    python benchmarks/table_memory.py [--records 1000000]
+"""
+from typing import Callable, Iterator
+import tracemalloc
+import argparse
+import datetime
+import gc
+import sys
+
+import _common  # noqa: F401
+from funpay.enums import StatusOrder, OrderType
+from funpay.tables import OrderTable, MessageTable
+from funpay.types import OrderCut, Message, UserCut
+
+START = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=3)))
+
+
+def orders(records: int) -> Iterator['OrderCut']:
+    for i in range(records):
+        yield OrderCut(
+            id=f"C{i:07d}",
+            title=f"Item {i % 50}",
+            status=StatusOrder(i % 3),
+            price=1.5 * i,
+            start_date=START + datetime.timedelta(seconds=i),
+            order_type=OrderType.SALE,
+            user=UserCut(id=i % 1000, username=f"user{i % 1000}")
+        )
+
+
+def messages(records: int) -> Iterator['Message']:
+    for i in range(records):
+        yield Message(
+            id=i,
+            chat_id=i % 500,
+            content=f"message text {i}",
+            author=UserCut(id=i % 1000, username=f"user{i % 1000}"),
+            date=START + datetime.timedelta(seconds=i)
+        )
+
+
+def traced_size(build: Callable[[], object]) -> tuple[int, object]:
+    """Returns the memory allocated while building the collection and the collection."""
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        collection = build()
+        return tracemalloc.get_traced_memory()[0], collection
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000, help="Records per collection")
+    args = parser.parse_args()
+
+    for name, rows, table in (("orders", orders, OrderTable), ("messages", messages, MessageTable)):
+        list_size, collection = traced_size(lambda: list(rows(args.records)))
+        del collection
+
+        table_size, collection = traced_size(lambda: table(rows(args.records)))
+        assert list(collection) == list(rows(args.records)), f"{name}: table rows differ"
+        del collection
+
+        print(f"{name:8} {args.records} records   list {list_size / 2 ** 20:7.1f} MiB   "
+              f"table {table_size / 2 ** 20:7.1f} MiB   x{list_size / table_size:.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
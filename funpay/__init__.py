@@ -1,2 +1,12 @@
-from .api import FunpayAPI
+from typing import TYPE_CHECKING
 
+from funpay.utils import lazy_attributes
+
+if TYPE_CHECKING:
+    from .api import FunpayAPI
+
+__all__ = ["FunpayAPI"]
+
+__getattr__ = lazy_attributes(__name__, {
+    "FunpayAPI": ".api"
+})
@@ -1,12 +1,18 @@
 from typing import Optional, TYPE_CHECKING, Union
 
 from funpay.http import AioHttpClient, BaseClient
-from funpay.services import LotsService, ReviewsService, ChatService, OrdersService
-from funpay.runner import Runner
-from funpay.parsers.html import FunpayAccountHtmlParser, FunpayUserProfileHtmlParser
+from funpay.enums import HtmlBackend, ParseMode
+from funpay.catalog import Catalog
+from funpay.bump import BumpEngine
+from funpay.history import ChatHistory
+from funpay.sender import MessageSender
+from funpay.order_book import OrderBook
+from funpay.executor import ParseExecutor
 
 if TYPE_CHECKING:
     from funpay.types import Account, User
+    from funpay.services import LotsService, ReviewsService, ChatService, OrdersService
+    from funpay.runner import Runner, PollScheduler
 
 
 class FunpayAPI:
@@ -22,10 +28,24 @@ class FunpayAPI:
         golden_key (str): Account authentication key (golden_key from cookies)
         client (Optional[BaseClient]): Custom HTTP services instance. If None,
             a default Requester will be initialized.
+        html_backend (HtmlBackend | str): Tree builder used by all HTML parsers
+            ("html.parser" by default, "lxml" requires the lxml package).
+        parse_mode (ParseMode | str): Where responses are parsed: "inline" (default),
+            "thread" or "process" pool, keeping large pages off the event loop.
+        parse_executor (Optional[ParseExecutor]): Executor shared with other accounts.
+            If given, ``parse_mode`` is ignored and the executor is not closed
+            together with this instance.
 
     Attributes:
         _golden_key (str): Stored authentication key
         client (BaseClient): HTTP services for making requests
+        html_backend (HtmlBackend): Selected HTML tree builder
+        parse_executor (ParseExecutor): Runs the parsers in the selected mode
+        catalog (Catalog): Game/node index shared by all services
+        bump_engine (BumpEngine): Raise cooldowns of the account's nodes
+        chat_history (ChatHistory): Per-chat sync cursors and message buffers
+        sender (MessageSender): Queue of outgoing messages of the account
+        order_book (OrderBook): Incrementally synced sales and purchases
         _account (Optional[Account]): Cached account data
 
     Note:
@@ -33,17 +53,37 @@ class FunpayAPI:
         after calling login() method.
     """
 
-    def __init__(self, golden_key: Optional[str] = None, *, client: Optional['BaseClient'] = None):
+    def __init__(
+        self,
+        golden_key: Optional[str] = None,
+        *,
+        client: Optional['BaseClient'] = None,
+        html_backend: HtmlBackend | str = HtmlBackend.HTML_PARSER,
+        parse_mode: ParseMode | str = ParseMode.INLINE,
+        parse_executor: Optional['ParseExecutor'] = None
+    ):
         self._golden_key = golden_key
         self.client = client if client else AioHttpClient(golden_key)
+        self.html_backend = HtmlBackend(html_backend)
+        self.parse_executor = parse_executor if parse_executor else ParseExecutor(parse_mode)
+        self.catalog = Catalog(self.client, html_backend=self.html_backend, executor=self.parse_executor)
+        self.bump_engine = BumpEngine(self.client, self.catalog)
+        self.chat_history = ChatHistory()
+        self.sender = MessageSender()
+        self.order_book = OrderBook(html_backend=self.html_backend, executor=self.parse_executor)
 
         self._account = None
+        self._runner = None
+        self._owns_executor = parse_executor is None
 
     async def __aenter__(self) -> 'FunpayAPI':
         return await self.login()
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.session.close()
+        await self.client.close()
+
+        if self._owns_executor:
+            await self.parse_executor.close()
 
     @property
     def account(self) -> Union['Account', None]:
@@ -57,37 +97,76 @@ class FunpayAPI:
     @property
     def lots(self) -> 'LotsService':
         """Service for managing FunPay lots"""
+        from funpay.services import LotsService
+
         return LotsService(
             account=self.account,
-            client=self.client
+            client=self.client,
+            html_backend=self.html_backend,
+            catalog=self.catalog,
+            bump_engine=self.bump_engine,
+            executor=self.parse_executor
         )
 
     @property
     def reviews(self) -> 'ReviewsService':
         """Service for managing FunPay reviews"""
+        from funpay.services import ReviewsService
+
         return ReviewsService(
             account=self.account,
-            client=self.client
+            client=self.client,
+            html_backend=self.html_backend,
+            catalog=self.catalog,
+            executor=self.parse_executor
         )
 
     @property
     def orders(self) -> 'OrdersService':
         """Service for managing FunPay orders"""
+        from funpay.services import OrdersService
+
         return OrdersService(
             account=self.account,
-            client=self.client
+            client=self.client,
+            html_backend=self.html_backend,
+            catalog=self.catalog,
+            order_book=self.order_book,
+            executor=self.parse_executor
         )
 
     @property
     def chat(self) -> 'ChatService':
         """Service for managing chat operations and message handling"""
+        from funpay.services import ChatService
+
         return ChatService(
             account=self.account,
-            client=self.client
+            client=self.client,
+            html_backend=self.html_backend,
+            catalog=self.catalog,
+            history=self.chat_history,
+            sender=self.sender,
+            executor=self.parse_executor
         )
 
-    def get_runner(self) -> 'Runner':
-        return Runner(self)
+    def use_parse_executor(self, executor: 'ParseExecutor') -> None:
+        """Switches the account to a shared executor that is closed by its owner."""
+        self.parse_executor = executor
+        self.catalog.executor = executor
+        self.order_book.executor = executor
+        self._owns_executor = False
+
+    def get_runner(self, *, scheduler: Optional['PollScheduler'] = None) -> 'Runner':
+        """Returns the update runner of this account (created on first call)."""
+        from funpay.runner import Runner
+
+        if not self._runner:
+            self._runner = Runner(self, scheduler=scheduler)
+        elif scheduler:
+            self._runner.scheduler = scheduler
+
+        return self._runner
 
     async def login(self) -> 'FunpayAPI':
         """Authenticates the user and initializes account data.
@@ -100,15 +179,21 @@ class FunpayAPI:
         Returns:
             FunpayAPI: Returns self for method chaining
         """
+        from funpay.parsers.html import FunpayAccountHtmlParser
 
         html = await self.client.request.fetch_main_page()
-        self._account = FunpayAccountHtmlParser(html).parse()
+        self._account = await self.parse_executor.parse(FunpayAccountHtmlParser, html, backend=self.html_backend)
         return self
 
     async def get_user(self, user_id: int) -> 'User':
+        from funpay.parsers.html import FunpayUserProfileHtmlParser
+
         html = await self.client.request.fetch_users_page(user_id)
 
-        user = FunpayUserProfileHtmlParser(html).parse(
+        user = await self.parse_executor.parse(
+            FunpayUserProfileHtmlParser,
+            html,
+            backend=self.html_backend,
             locale=self.account.locale,
             user_id=user_id
         )
@@ -0,0 +1,94 @@
+from typing import TYPE_CHECKING, Iterable, Optional
+import asyncio
+import time
+
+from funpay.types import RaiseNode
+
+if TYPE_CHECKING:
+    from funpay.http import BaseClient
+    from funpay.catalog import Catalog
+    from funpay.types import Node
+
+
+class BumpEngine:
+    """Raises marketplace nodes once per node and remembers their cooldowns.
+
+    FunPay raises offers per node, so the engine sends a single ``/lots/raise``
+    request for every distinct node. When FunPay answers with a wait time, the
+    node's next eligible time is stored and later calls skip the node without
+    touching the network until the cooldown is over.
+
+    Args:
+        client (BaseClient): Client used to send raise requests
+        catalog (Catalog): Index used to resolve the game of a node
+    """
+
+    def __init__(self, client: 'BaseClient', catalog: 'Catalog'):
+        self.client = client
+        self.catalog = catalog
+
+        self._schedule: dict[int, tuple[float, 'RaiseNode']] = {}
+
+    @property
+    def schedule(self) -> dict[int, float]:
+        """Next eligible time (time.monotonic) of every node on cooldown."""
+        now = time.monotonic()
+        return {node_id: eligible_at for node_id, (eligible_at, _) in self._schedule.items() if eligible_at > now}
+
+    def next_eligible(self, node_id: int) -> float:
+        """Returns the time (time.monotonic) from which the node may be raised."""
+        eligible_at, _ = self._schedule.get(node_id, (0.0, None))
+        return eligible_at
+
+    def _get_skipped(self, node: 'Node') -> Optional['RaiseNode']:
+        eligible_at, result = self._schedule.get(node.id, (0.0, None))
+        remaining = eligible_at - time.monotonic()
+
+        if remaining <= 0:
+            return None
+
+        return RaiseNode(
+            node=node,
+            message=result.message,
+            success=False,
+            cooldown=int(remaining)
+        )
+
+    async def raise_node(self, node: 'Node') -> 'RaiseNode':
+        """Raises a single node unless it is still on cooldown.
+
+        A node missing from the catalog is reported as not raised, without a
+        request.
+        """
+        from funpay.parsers.json import RaiseNodeJsonParser
+
+        if skipped := self._get_skipped(node):
+            return skipped
+
+        game = await self.catalog.get_game_by_node(node.id)
+
+        if not game:
+            return RaiseNode(node=node, message=f"Node={node.id} is not in the catalog", success=False)
+
+        data = await self.client.request.send_raise(
+            game_id=game.id,
+            node_id=node.id
+        )
+
+        result = RaiseNodeJsonParser(data).parse(node=node)
+
+        if result.cooldown:
+            self._schedule[node.id] = (time.monotonic() + result.cooldown, result)
+        else:
+            self._schedule.pop(node.id, None)
+
+        return result
+
+    async def raise_nodes(self, nodes: Iterable['Node']) -> list['RaiseNode']:
+        """Raises every distinct node concurrently; nodes on cooldown are reported as skipped."""
+        unique_nodes = {node.id: node for node in nodes}
+
+        return list(await asyncio.gather(*(
+            self.raise_node(node)
+            for node in unique_nodes.values()
+        )))
@@ -0,0 +1,75 @@
+from typing import TYPE_CHECKING, Optional
+import asyncio
+import time
+
+from funpay.enums import HtmlBackend
+from funpay.executor import ParseExecutor
+
+if TYPE_CHECKING:
+    from funpay.http import BaseClient
+    from funpay.types import Game
+
+
+class Catalog:
+    """Index of FunPay games and their nodes built from the main page.
+
+    The main page is parsed once per ``ttl`` and indexed by node id and game id,
+    so lookups are O(1) dictionary accesses. The game list is the same for every
+    account, so one catalog can be shared by all services and accounts.
+
+    Args:
+        client (BaseClient): Client used to fetch the main page
+        ttl (float): Seconds before the catalog is rebuilt
+        html_backend (HtmlBackend): Tree builder used to parse the main page
+        executor (Optional[ParseExecutor]): Where the main page is parsed on refresh.
+            If None, it is parsed inline.
+    """
+
+    def __init__(
+        self,
+        client: 'BaseClient',
+        *,
+        ttl: float = 3600,
+        html_backend: 'HtmlBackend' = HtmlBackend.HTML_PARSER,
+        executor: Optional['ParseExecutor'] = None
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.html_backend = html_backend
+        self.executor = executor if executor else ParseExecutor()
+
+        self._games: dict[int, 'Game'] = {}
+        self._games_by_node: dict[int, 'Game'] = {}
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def games(self) -> list['Game']:
+        return list(self._games.values())
+
+    def _index(self, games: list['Game']) -> None:
+        self._games = {int(game.id): game for game in games}
+        self._games_by_node = {int(node.id): game for game in games for node in game.nodes}
+        self._expires_at = time.monotonic() + self.ttl
+
+    async def refresh(self, *, force: bool = False) -> None:
+        """Rebuilds the catalog if it is expired (or always, with ``force``)."""
+        from funpay.parsers.html import FunpayGamesHtmlParser
+
+        async with self._lock:
+            if not force and time.monotonic() < self._expires_at:
+                return
+
+            if force:
+                self.client.cache.invalidate("fetch_main_page")
+
+            html = await self.client.request.fetch_main_page()
+            self._index(await self.executor.parse(FunpayGamesHtmlParser, html, backend=self.html_backend))
+
+    async def get_game(self, game_id: int) -> Optional['Game']:
+        await self.refresh()
+        return self._games.get(int(game_id))
+
+    async def get_game_by_node(self, node_id: int) -> Optional['Game']:
+        await self.refresh()
+        return self._games_by_node.get(int(node_id))
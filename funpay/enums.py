@@ -26,3 +26,25 @@ class EventType(StrEnum):
     ORDER = "order"
     CHAT = "chat"
 
+
+class HtmlBackend(StrEnum):
+    HTML_PARSER = "html.parser"
+    LXML = "lxml"
+
+
+class RequestCategory(StrEnum):
+    PAGE = "page"
+    RUNNER = "runner"
+    ACTION = "action"
+
+
+class Priority(IntEnum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class ParseMode(StrEnum):
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
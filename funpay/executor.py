@@ -0,0 +1,159 @@
+from typing import TYPE_CHECKING, Any, Callable, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+import functools
+import asyncio
+import time
+
+from funpay.enums import ParseMode, HtmlBackend
+
+if TYPE_CHECKING:
+    from funpay.parsers import ABCParser
+
+
+def _parse(parser: type['ABCParser'], data: Any, backend: 'HtmlBackend', kwargs: dict) -> Any:
+    return parser(data, backend=backend).parse(**kwargs)
+
+
+class ParseExecutor:
+    """Runs response parsers inline, in a thread pool or in a process pool.
+
+    Parsing a large page with BeautifulSoup blocks for tens of milliseconds.
+    In ``thread`` mode the event loop keeps running while a worker thread
+    parses; in ``process`` mode parsing also runs in parallel with the loop's
+    own Python code. Workers receive the raw HTML/JSON and return the parsed
+    domain objects, so no BeautifulSoup tree ever crosses the process boundary.
+
+    One executor may be shared by many accounts (see ``FunpayAPI`` and
+    ``Supervisor``), so all of them parse in a single pool.
+
+    Args:
+        mode (ParseMode | str): "inline" (default), "thread" or "process"
+        max_workers (Optional[int]): Size of the pool (executor default if None)
+    """
+
+    def __init__(self, mode: ParseMode | str = ParseMode.INLINE, *, max_workers: Optional[int] = None):
+        self.mode = ParseMode(mode)
+        self.max_workers = max_workers
+
+        self._pool: Optional['Executor'] = None
+
+        self._calls = 0
+        self._total_time = 0.0
+        self._max_time = 0.0
+
+    def _get_pool(self) -> 'Executor':
+        if not self._pool:
+            if self.mode == ParseMode.PROCESS:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='funpay-parser')
+
+        return self._pool
+
+    async def call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Runs ``func(*args)`` according to the mode.
+
+        In process mode ``func`` must be a module-level function and the
+        arguments and the result must be picklable.
+        """
+        started = time.monotonic()
+
+        try:
+            if self.mode == ParseMode.INLINE:
+                return func(*args)
+
+            return await asyncio.get_running_loop().run_in_executor(self._get_pool(), func, *args)
+        finally:
+            elapsed = time.monotonic() - started
+
+            self._calls += 1
+            self._total_time += elapsed
+            self._max_time = max(self._max_time, elapsed)
+
+    async def parse(
+        self,
+        parser: type['ABCParser'],
+        data: Any,
+        *,
+        backend: 'HtmlBackend' = HtmlBackend.HTML_PARSER,
+        **kwargs: Any
+    ) -> Any:
+        """Returns ``parser(data, backend=backend).parse(**kwargs)``."""
+        return await self.call(_parse, parser, data, backend, kwargs)
+
+    async def close(self) -> None:
+        """Cancels pending parses and shuts the pool down without blocking the event loop.
+
+        The shutdown still waits for the running workers (in a helper thread):
+        a process pool left running at interpreter exit fails in its atexit hook.
+        """
+        if self._pool:
+            pool, self._pool = self._pool, None
+            shutdown = functools.partial(pool.shutdown, wait=True, cancel_futures=True)
+            await asyncio.get_running_loop().run_in_executor(None, shutdown)
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode.value,
+            "calls": self._calls,
+            "average_time": self._total_time / self._calls if self._calls else 0.0,
+            "max_time": self._max_time
+        }
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up a periodic sleeper.
+
+    Any synchronous work (such as inline parsing) delays every other task on
+    the loop; the delay shows up here as lag above zero.
+
+    One monitor may be shared by several owners (runners of one loop): every
+    ``start()`` must be paired with a ``stop()`` and the measuring task runs
+    while at least one owner has not stopped it.
+
+    Args:
+        interval (float): Seconds between two measurements
+    """
+
+    def __init__(self, *, interval: float = 0.05):
+        self.interval = interval
+
+        self._task: Optional['asyncio.Task'] = None
+        self._users = 0
+
+        self._samples = 0
+        self._total_lag = 0.0
+        self._max_lag = 0.0
+        self._last_lag = 0.0
+
+    async def _run(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag = max(time.monotonic() - started - self.interval, 0.0)
+
+            self._samples += 1
+            self._total_lag += lag
+            self._max_lag = max(self._max_lag, lag)
+            self._last_lag = lag
+
+    def start(self) -> None:
+        self._users += 1
+
+        if not self._task or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        self._users = max(self._users - 1, 0)
+
+        if self._task and not self._users:
+            self._task.cancel()
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "samples": self._samples,
+            "average_lag": self._total_lag / self._samples if self._samples else 0.0,
+            "max_lag": self._max_lag,
+            "last_lag": self._last_lag
+        }
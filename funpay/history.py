@@ -0,0 +1,88 @@
+from typing import TYPE_CHECKING, Iterable, Optional
+from collections import deque
+import sys
+
+if TYPE_CHECKING:
+    from funpay.types import Message
+
+
+class ChatHistory:
+    """Per-chat cursors and bounded buffers of already received messages.
+
+    The cursor of a chat is the id of the newest message seen in it. Merging a
+    page of messages keeps only those above the cursor, appends them to the
+    chat's ring buffer (oldest messages are dropped after ``maxlen``) and moves
+    the cursor forward.
+
+    Args:
+        maxlen (int): Number of messages kept per chat
+        cursors (Optional[dict[int, int]]): Previously saved cursors to resume from
+
+    Attributes:
+        cursors (dict[int, int]): Id of the newest seen message of every chat.
+            Save it to resume the sync after a restart.
+    """
+
+    def __init__(self, *, maxlen: int = 100, cursors: Optional[dict[int, int]] = None):
+        self.maxlen = maxlen
+        self.cursors = {int(chat_id): int(message_id) for chat_id, message_id in (cursors or {}).items()}
+
+        self._buffers: dict[int, deque['Message']] = {}
+
+    def cursor(self, chat_id: int) -> Optional[int]:
+        """Returns the id of the newest seen message of the chat."""
+        return self.cursors.get(int(chat_id))
+
+    def messages(self, chat_id: int) -> list['Message']:
+        """Returns the buffered messages of the chat, oldest first."""
+        return list(self._buffers.get(int(chat_id), ()))
+
+    def last_message(self, chat_id: int) -> Optional['Message']:
+        buffer = self._buffers.get(int(chat_id))
+        return buffer[-1] if buffer else None
+
+    def merge(self, chat_id: int, messages: Iterable['Message']) -> list['Message']:
+        """Adds messages newer than the cursor and returns them, oldest first."""
+        chat_id = int(chat_id)
+        cursor = self.cursors.get(chat_id, 0)
+        new_messages = sorted(
+            (message for message in messages if message.id > cursor),
+            key=lambda message: message.id
+        )
+
+        if not new_messages:
+            return []
+
+        buffer = self._buffers.get(chat_id)
+
+        if buffer is None:
+            buffer = self._buffers[chat_id] = deque(maxlen=self.maxlen)
+
+        buffer.extend(new_messages)
+        self.cursors[chat_id] = new_messages[-1].id
+        return new_messages
+
+    def reset(self, chat_id: Optional[int] = None) -> None:
+        """Forgets one chat, or every chat when ``chat_id`` is None."""
+        if chat_id is None:
+            self.cursors.clear()
+            self._buffers.clear()
+            return
+
+        self.cursors.pop(int(chat_id), None)
+        self._buffers.pop(int(chat_id), None)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the cursors and the buffered messages."""
+        return sys.getsizeof(self.cursors) + sum(
+            sys.getsizeof(buffer) + sum(sys.getsizeof(message) + sys.getsizeof(message.content) for message in buffer)
+            for buffer in self._buffers.values()
+        )
+
+    def stats(self) -> dict:
+        return {
+            "chats": len(self.cursors),
+            "buffered": sum(len(buffer) for buffer in self._buffers.values()),
+            "nbytes": self.nbytes
+        }
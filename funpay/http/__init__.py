@@ -1,2 +1,6 @@
 from .aiohttp_client import AioHttpClient
 from .base_client import BaseClient
+from .cache import ResponseCache
+from .limiter import RateLimiter, Limit
+from .resilience import RetryPolicy, CircuitBreaker
+from .pool import ConnectionPool
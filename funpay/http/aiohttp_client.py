@@ -1,14 +1,81 @@
+from typing import Optional, TYPE_CHECKING
+
 import aiohttp
 
 from .base_client import BaseClient
 from .request import Request
+from .pool import ConnectionPool
+
+if TYPE_CHECKING:
+    from .cache import ResponseCache
+    from .limiter import RateLimiter
+    from .resilience import RetryPolicy, CircuitBreaker
 
 
 class AioHttpClient(BaseClient[aiohttp.ClientSession]):
+    """aiohttp implementation of the HTTP client.
+
+    Args:
+        golden_key (str): Account authentication key
+        cache (Optional[ResponseCache]): Cache for fetched pages
+        limiter (Optional[RateLimiter]): Per-account request limiter
+        retry_policy (Optional[RetryPolicy]): Deadlines and retries of requests
+        breaker (Optional[CircuitBreaker]): Circuit breaker of the client
+        user_agent (Optional[str]): User-Agent of the account
+        pool (Optional[ConnectionPool]): Connection pool, may be shared with other
+            clients. If None, a private pool is created and closed together with the client.
+    """
+
+    def __init__(
+        self,
+        golden_key: str,
+        *,
+        cache: Optional['ResponseCache'] = None,
+        limiter: Optional['RateLimiter'] = None,
+        retry_policy: Optional['RetryPolicy'] = None,
+        breaker: Optional['CircuitBreaker'] = None,
+        user_agent: Optional[str] = None,
+        pool: Optional['ConnectionPool'] = None
+    ):
+        super().__init__(
+            golden_key,
+            cache=cache,
+            limiter=limiter,
+            retry_policy=retry_policy,
+            breaker=breaker,
+            user_agent=user_agent
+        )
+        self.pool = pool if pool else ConnectionPool()
+        self._owns_pool = pool is None
+
+    async def use_pool(self, pool: 'ConnectionPool') -> None:
+        """Switches the client to a shared pool that is closed by its owner.
+
+        An open session is bound to the connector of the previous pool, so it is
+        closed (together with the previous pool if the client owned it) and the
+        next request opens a new session on the shared pool.
+        """
+        if pool is self.pool:
+            return
+
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+        if self._owns_pool:
+            await self.pool.close()
+
+        self.pool = pool
+        self._owns_pool = False
+
     def get_session(self) -> 'aiohttp.ClientSession':
         if not self.session or self.session.closed:
             self.session = aiohttp.ClientSession(
-                base_url=self.BASE_URL
+                base_url=self.BASE_URL,
+                cookies={"golden_key": self.golden_key} if self.golden_key else None,
+                connector=self.pool.get_connector(),
+                connector_owner=False,
+                trace_configs=[self.pool.trace_config]
             )
 
         return self.session
@@ -17,6 +84,9 @@ class AioHttpClient(BaseClient[aiohttp.ClientSession]):
         if self.session:
             await self.session.close()
 
+        if self._owns_pool:
+            await self.pool.close()
+
     @property
     def request(self) -> 'Request':
         return Request[aiohttp.ClientResponse](self)
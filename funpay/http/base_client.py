@@ -1,6 +1,11 @@
-from typing import TypeVar, Generic, TYPE_CHECKING
+from typing import TypeVar, Generic, TYPE_CHECKING, Optional
 from abc import ABC, abstractmethod
 
+from .cache import ResponseCache
+from .limiter import RateLimiter
+from .resilience import RetryPolicy, CircuitBreaker
+from .headers import HeaderProfile
+
 if TYPE_CHECKING:
     from .request import Request
 
@@ -20,6 +25,19 @@ class BaseClient(ABC, Generic[T]):
     Class Attributes:
         BASE_URL (str): Base API endpoint URL (default: FunPay's production)
 
+    Args:
+        golden_key (str): Account authentication key
+        cache (Optional[ResponseCache]): Cache for fetched pages. If None,
+            a default ResponseCache will be initialized.
+        limiter (Optional[RateLimiter]): Per-account request limiter. If None,
+            a default RateLimiter will be initialized.
+        retry_policy (Optional[RetryPolicy]): Deadlines and retries of requests. If None,
+            a default RetryPolicy will be initialized.
+        breaker (Optional[CircuitBreaker]): Circuit breaker of the client. If None,
+            a default CircuitBreaker will be initialized.
+        user_agent (Optional[str]): User-Agent of the account. If None, a random one
+            is chosen once and kept for the lifetime of the client.
+
     Methods:
         get(): Retrieves the active http instance
         close(): Cleanly terminates the http
@@ -31,9 +49,23 @@ class BaseClient(ABC, Generic[T]):
 
     BASE_URL: str = 'https://funpay.com'
 
-    def __init__(self, golden_key: str):
+    def __init__(
+        self,
+        golden_key: str,
+        *,
+        cache: Optional['ResponseCache'] = None,
+        limiter: Optional['RateLimiter'] = None,
+        retry_policy: Optional['RetryPolicy'] = None,
+        breaker: Optional['CircuitBreaker'] = None,
+        user_agent: Optional[str] = None
+    ):
         self.golden_key = golden_key
         self.session = None
+        self.cache = cache if cache is not None else ResponseCache()
+        self.limiter = limiter if limiter else RateLimiter()
+        self.retry_policy = retry_policy if retry_policy else RetryPolicy()
+        self.breaker = breaker if breaker else CircuitBreaker()
+        self.headers = HeaderProfile(self.BASE_URL, user_agent)
 
     @abstractmethod
     def get_session(self) -> T:
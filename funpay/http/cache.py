@@ -0,0 +1,139 @@
+from typing import TYPE_CHECKING, Any, Callable, Awaitable, Optional, Hashable
+from collections import OrderedDict
+from functools import wraps
+import inspect
+import time
+import sys
+
+if TYPE_CHECKING:
+    from .request import Request
+
+
+class ResponseCache:
+    """Bounded LRU cache of fetched pages owned by an HTTP client.
+
+    Keys depend only on the endpoint name and its arguments, so every
+    ``Request`` created by the same client shares the stored responses.
+
+    Args:
+        maxsize (int): Maximum number of stored responses (least recently used are evicted)
+        ttls (Optional[dict[str, float]]): Per-endpoint TTL overrides in seconds,
+            e.g. ``{"fetch_sales_page": 2}``. A TTL of 0 disables caching for the endpoint.
+
+    Attributes:
+        hits (int): Number of lookups answered from the cache
+        misses (int): Number of lookups that went to the network
+    """
+
+    def __init__(self, maxsize: int = 256, ttls: Optional[dict[str, float]] = None):
+        self.maxsize = maxsize
+        self.ttls = dict(ttls or {})
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict[tuple, tuple[float, Any]]()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(endpoint: str, *args: Hashable) -> tuple:
+        return (endpoint, *(str(arg) for arg in args))
+
+    def get_ttl(self, endpoint: str, default: float) -> float:
+        return self.ttls.get(endpoint, default)
+
+    def get(self, key: tuple) -> Any:
+        """Returns a stored response or None if it is missing or expired."""
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: tuple, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str, *args: Hashable) -> None:
+        """Drops cached responses of an endpoint.
+
+        Args:
+            endpoint: Name of the ``Request`` method, e.g. ``"fetch_order_page"``
+            *args: Arguments of the call. When omitted, every response of the endpoint is dropped.
+        """
+        if args:
+            self._entries.pop(self.make_key(endpoint, *args), None)
+            return
+
+        for key in [key for key in self._entries if key[0] == endpoint]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the stored responses."""
+        return sum(sys.getsizeof(value) for _, value in self._entries.values())
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+
+        return {
+            "size": len(self._entries),
+            "nbytes": self.nbytes,
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0
+        }
+
+
+def cached_response(ttl: float) -> Callable:
+    """Caches the result of a ``Request`` method in its client's ``ResponseCache``.
+
+    Args:
+        ttl: Default time to live in seconds, can be overridden with ``ResponseCache.ttls``
+    """
+
+    def decorator(func: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+        endpoint = func.__name__
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(self: 'Request', *args: Hashable, **kwargs: Hashable) -> Any:
+            arguments = list(signature.bind(self, *args, **kwargs).arguments.values())[1:]
+
+            cache = self.client.cache
+            key = cache.make_key(endpoint, *arguments)
+
+            value = cache.get(key)
+            if value is not None:
+                return value
+
+            value = await func(self, *arguments)
+            cache.set(key, value, cache.get_ttl(endpoint, ttl))
+            return value
+
+        return wrapper
+
+    return decorator
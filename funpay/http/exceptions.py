@@ -1,9 +1,30 @@
+from typing import Optional
+
+
 class HttpRequestError(Exception):
-    def __init__(self, status: int, url: str, text: str):
+    def __init__(self, status: int, url: str, text: str, retry_after: Optional[float] = None):
         self.status = status
         self.url = url
         self.text = text
+        self.retry_after = retry_after
 
     def __str__(self):
         return f"[ERROR {self.status}] - {self.url}"
 
+
+class NetworkError(Exception):
+    def __init__(self, url: str, reason: str):
+        self.url = url
+        self.reason = reason
+
+    def __str__(self):
+        return f"[NETWORK ERROR] - {self.url}: {self.reason}"
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, url: str, retry_after: float):
+        self.url = url
+        self.retry_after = retry_after
+
+    def __str__(self):
+        return f"[CIRCUIT OPEN] - {self.url} (retry in {self.retry_after:.1f}s)"
@@ -0,0 +1,53 @@
+from typing import Optional, TYPE_CHECKING
+from functools import cache
+from types import MappingProxyType
+
+from funpay.enums import ResponseType
+
+if TYPE_CHECKING:
+    from fake_useragent import FakeUserAgent
+
+
+@cache
+def _get_fake_user_agent() -> 'FakeUserAgent':
+    """Loads the fake_useragent dataset once, only when a random User-Agent is needed."""
+    from fake_useragent import FakeUserAgent
+
+    return FakeUserAgent()
+
+
+class HeaderProfile:
+    """Static request headers of one account.
+
+    The User-Agent is chosen once per account (rotating it on every request looks
+    suspicious) and the header sets for every response type are built up front,
+    so requests do not allocate or format headers.
+
+    Args:
+        base_url (str): Origin used for the Origin/Referer headers
+        user_agent (Optional[str]): Fixed User-Agent. If None, a random one is picked once.
+    """
+
+    def __init__(self, base_url: str, user_agent: Optional[str] = None):
+        self.user_agent = user_agent if user_agent else _get_fake_user_agent().random
+
+        text_headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "application/json, text/html"
+        }
+
+        json_headers = {
+            **text_headers,
+            "Content-Type": "application/x-www-form-urlencoded",
+            "X-Requested-With": "XMLHttpRequest",
+            "Origin": base_url,
+            "Referer": f"{base_url}/"
+        }
+
+        self._headers = {
+            ResponseType.TEXT: MappingProxyType(text_headers),
+            ResponseType.JSON: MappingProxyType(json_headers)
+        }
+
+    def get(self, response_type: 'ResponseType') -> MappingProxyType:
+        return self._headers[response_type]
@@ -0,0 +1,154 @@
+from typing import Optional, AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import itertools
+import asyncio
+import heapq
+import time
+
+from funpay.enums import RequestCategory, Priority
+
+
+@dataclass(frozen=True)
+class Limit:
+    """Rate and concurrency limit of one request category.
+
+    Attributes:
+        rate (float): Sustained requests per second (token refill rate)
+        burst (int): Token bucket capacity
+        concurrency (int): Maximum number of requests in flight
+    """
+    rate: float
+    burst: int
+    concurrency: int
+
+
+DEFAULT_LIMITS = {
+    RequestCategory.PAGE: Limit(rate=2, burst=5, concurrency=4),
+    RequestCategory.RUNNER: Limit(rate=1, burst=3, concurrency=2),
+    RequestCategory.ACTION: Limit(rate=2, burst=5, concurrency=2)
+}
+
+
+class _CategoryState:
+    def __init__(self, limit: 'Limit'):
+        self.limit = limit
+        self.tokens = float(limit.burst)
+        self.updated_at = time.monotonic()
+        self.active = 0
+        self.waiters = list[tuple[int, int, asyncio.Future]]()
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+        self.requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.tokens + (now - self.updated_at) * self.limit.rate, self.limit.burst)
+        self.updated_at = now
+
+
+class RateLimiter:
+    """Token bucket and concurrency limiter for outgoing requests.
+
+    Every request category (page GETs, ``/runner/`` polls, mutating POSTs) has its
+    own bucket and concurrency limit. Waiting requests are released in priority
+    order, FIFO within a priority, so a chat reply is not queued behind bulk bumps.
+
+    A limiter can have a parent (e.g. one global limiter shared by all accounts);
+    a request then has to pass both.
+
+    Args:
+        limits (Optional[dict[RequestCategory, Limit]]): Overrides of DEFAULT_LIMITS
+        parent (Optional[RateLimiter]): Limiter acquired after this one
+    """
+
+    def __init__(
+        self,
+        limits: Optional[dict['RequestCategory', 'Limit']] = None,
+        *,
+        parent: Optional['RateLimiter'] = None
+    ):
+        self.parent = parent
+
+        self._states = {
+            category: _CategoryState(limit)
+            for category, limit in {**DEFAULT_LIMITS, **(limits or {})}.items()
+        }
+        self._counter = itertools.count()
+
+    def _wake(self, state: '_CategoryState') -> None:
+        state.timer = None
+        state.refill()
+
+        while state.waiters and state.active < state.limit.concurrency:
+            _, _, future = state.waiters[0]
+
+            if future.done():
+                heapq.heappop(state.waiters)
+                continue
+
+            if state.tokens < 1:
+                delay = (1 - state.tokens) / state.limit.rate
+                state.timer = asyncio.get_running_loop().call_later(delay, self._wake, state)
+                return
+
+            heapq.heappop(state.waiters)
+            state.tokens -= 1
+            state.active += 1
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        category: 'RequestCategory',
+        priority: 'Priority' = Priority.NORMAL
+    ) -> AsyncIterator[None]:
+        """Waits for a token and a free slot of the category and holds the slot."""
+        state = self._states[category]
+        started = time.monotonic()
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(state.waiters, (priority, next(self._counter), future))
+
+        if not state.timer:
+            self._wake(state)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                state.active -= 1
+                self._wake(state)
+            raise
+
+        waited = time.monotonic() - started
+        state.requests += 1
+        state.total_wait += waited
+        state.max_wait = max(state.max_wait, waited)
+
+        try:
+            if self.parent:
+                async with self.parent.acquire(category, priority):
+                    yield
+            else:
+                yield
+        finally:
+            state.active -= 1
+
+            if not state.timer:
+                self._wake(state)
+
+    def stats(self) -> dict[str, dict]:
+        """Returns queue depth, in-flight requests and wait times per category."""
+        return {
+            category.value: {
+                "queued": sum(not future.done() for _, _, future in state.waiters),
+                "active": state.active,
+                "requests": state.requests,
+                "average_wait": state.total_wait / state.requests if state.requests else 0.0,
+                "max_wait": state.max_wait
+            }
+            for category, state in self._states.items()
+        }
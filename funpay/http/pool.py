@@ -0,0 +1,102 @@
+from typing import Optional, Union
+import ssl
+import time
+
+import aiohttp
+
+
+class ConnectionPool:
+    """Configurable aiohttp connection pool that can be shared by many clients.
+
+    Keeps TCP/TLS connections to FunPay alive between requests, caches DNS
+    lookups and reuses one SSL context, so periodic ``/runner/`` polls do not
+    pay for a cold handshake. Pool usage is tracked through aiohttp tracing.
+
+    Args:
+        limit (int): Maximum number of simultaneous connections
+        limit_per_host (int): Maximum number of simultaneous connections to one host
+        keepalive_timeout (float): Seconds an idle connection is kept open
+        ttl_dns_cache (Optional[int]): Seconds DNS lookups are cached (None caches forever)
+        ssl_context (Optional[ssl.SSLContext | bool]): TLS settings. If None, one
+            default context is created and reused by every connection.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        keepalive_timeout: float = 75,
+        ttl_dns_cache: Optional[int] = 300,
+        ssl_context: Optional[Union['ssl.SSLContext', bool]] = None
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.ssl_context = ssl_context if ssl_context is not None else ssl.create_default_context()
+
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_connection_create_end.append(self._on_connection_create)
+        self.trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+        self.trace_config.on_connection_queued_start.append(self._on_queued_start)
+        self.trace_config.on_connection_queued_end.append(self._on_queued_end)
+
+        self._connector: Optional['aiohttp.TCPConnector'] = None
+
+        self._created = 0
+        self._reused = 0
+        self._waits = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def get_connector(self) -> 'aiohttp.TCPConnector':
+        """Returns the shared connector, creating it inside the running event loop."""
+        if not self._connector or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache,
+                ssl=self.ssl_context
+            )
+
+        return self._connector
+
+    async def close(self) -> None:
+        if self._connector:
+            await self._connector.close()
+
+    async def _on_connection_create(self, session, context, params) -> None:
+        self._created += 1
+
+    async def _on_connection_reuse(self, session, context, params) -> None:
+        self._reused += 1
+
+    async def _on_queued_start(self, session, context, params) -> None:
+        context.queued_at = time.monotonic()
+
+    async def _on_queued_end(self, session, context, params) -> None:
+        waited = time.monotonic() - context.queued_at
+
+        self._waits += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+
+    def stats(self) -> dict:
+        """Returns connection counts, reuse ratio and connection acquire wait times."""
+        connector = self._connector
+        idle = sum(len(conns) for conns in getattr(connector, '_conns', {}).values())
+        acquired = len(getattr(connector, '_acquired', ()))
+        total = self._created + self._reused
+
+        return {
+            "open": idle + acquired,
+            "in_use": acquired,
+            "created": self._created,
+            "reused": self._reused,
+            "reuse_ratio": self._reused / total if total else 0.0,
+            "queued": self._waits,
+            "average_wait": self._total_wait / self._waits if self._waits else 0.0,
+            "max_wait": self._max_wait
+        }
@@ -1,12 +1,11 @@
-from typing import TYPE_CHECKING, Literal, TypeVar, Generic
+from typing import TYPE_CHECKING, Literal, TypeVar, Generic, Optional, Mapping
 import logging
+import asyncio
 import json
 
-from fake_useragent import FakeUserAgent
-from aiocache import cached
-
-from funpay.http.exceptions import HttpRequestError
-from funpay.enums import ResponseType
+from funpay.http.exceptions import HttpRequestError, NetworkError
+from funpay.http.cache import cached_response
+from funpay.enums import ResponseType, RequestCategory, Priority
 
 if TYPE_CHECKING:
     from funpay.http import BaseClient
@@ -28,25 +27,20 @@ class Request(Generic[T]):
         self.logger = logging.getLogger('funpay.Request')
         self.client = client
 
-    def _get_headers(self, response_type: 'ResponseType') -> dict:
-        """Generate appropriate HTTP headers for the request method."""
+    def _get_headers(self, response_type: 'ResponseType') -> 'Mapping[str, str]':
+        """Returns the precomputed HTTP headers of the account for the response type."""
+        return self.client.headers.get(response_type)
 
-        base_headers = {
-            "User-Agent": FakeUserAgent().random,
-            "Cookie": f"golden_key={self.client.golden_key}",
-            "Accept": "application/json, text/html",
-            "Connection": "keep-alive"
-        }
+    @staticmethod
+    def _get_category(method: str, url: str) -> 'RequestCategory':
+        """Maps a request to the rate limit category it is accounted in."""
+        if url == '/runner/':
+            return RequestCategory.RUNNER
 
-        if response_type == ResponseType.JSON:
-            base_headers.update({
-                "Content-Type": "application/x-www-form-urlencoded",
-                "X-Requested-With": "XMLHttpRequest",
-                "Origin": self.client.BASE_URL,
-                "Referer": f"{self.client.BASE_URL}/"
-            })
+        if method == 'GET' or url in ('/orders/trade', '/orders/'):
+            return RequestCategory.PAGE
 
-        return base_headers
+        return RequestCategory.ACTION
 
     async def _send_request(
         self,
@@ -54,6 +48,8 @@ class Request(Generic[T]):
         method: Literal["POST", "GET"],
         url: str,
         response_type: 'ResponseType',
+        priority: 'Priority' = Priority.NORMAL,
+        idempotent: Optional[bool] = None,
         **kwargs: dict
     ) -> T:
         """Core method for sending HTTP requests with built-in error handling.
@@ -61,12 +57,20 @@ class Request(Generic[T]):
         Handles:
         - Session management
         - Header injection
+        - Rate limiting
+        - Deadlines, retries and circuit breaking
         - Error response detection
         - Request execution
 
+        The response body is read while the rate limit slot is held and under
+        the same deadline, so a stalled body is retried like a stalled request
+        and ``.text()``/``.json()`` of the returned response read the buffer.
+
         Args:
             method: HTTP verb ("POST" or "GET")
             url: Endpoint path (relative to base URL)
+            priority: Order in which queued requests of the same category are sent
+            idempotent: Whether the request may be retried (default: only GET requests)
             **kwargs: Additional arguments for aiohttp request
 
         Returns:
@@ -74,33 +78,72 @@ class Request(Generic[T]):
 
         Raises:
             HttpRequestError: For any 4xx/5xx status code responses
+            NetworkError: When no response was received after all attempts
+            CircuitOpenError: While the client's circuit breaker is open
         """
-        session = self.client.get_session()
-
-        response = await session.request(
-            method=method,
-            url=url,
-            headers=self._get_headers(response_type),
-            **kwargs
-        )
+        policy = self.client.retry_policy
+        breaker = self.client.breaker
+        max_attempts = policy.max_attempts if (method == 'GET' if idempotent is None else idempotent) else 1
+        delay = policy.base_delay
+
+        for attempt in range(1, max_attempts + 1):
+            breaker.before_request(url)
+            session = self.client.get_session()
+
+            try:
+                async with self.client.limiter.acquire(self._get_category(method, url), priority):
+                    async with asyncio.timeout(policy.timeout):
+                        response = await session.request(
+                            method=method,
+                            url=url,
+                            headers=self._get_headers(response_type),
+                            **kwargs
+                        )
+                        await response.read()
+
+            except policy.RETRY_EXCEPTIONS as e:
+                breaker.record_failure()
+                self.logger.warning(f"Method={method} Path={self.client.BASE_URL}{url} Error={e!r}")
+
+                if attempt == max_attempts:
+                    raise NetworkError(url=url, reason=repr(e)) from e
+
+                delay = policy.next_delay(delay)
+                await asyncio.sleep(delay)
+                continue
+
+            self.logger.info(
+                f"Method={method} "
+                f"Path={self.client.BASE_URL}{url} "
+                f"Status={response.status} "
+                f"Type={response_type.value}"
+            )
 
-        self.logger.info(
-            f"Method={method} "
-            f"Path={self.client.BASE_URL}{url} "
-            f"Status={response.status} "
-            f"Type={response_type.value}"
-        )
+            if response.status < 400:
+                breaker.record_success()
+                return response
 
-        if response.status >= 400:
-            raise HttpRequestError(
+            retry_after = policy.parse_retry_after(response.headers.get('Retry-After'))
+            error = HttpRequestError(
                 status=response.status,
                 url=url,
-                text=await response.text()
+                text=await response.text(),
+                retry_after=retry_after
             )
 
-        return response
+            if response.status not in policy.retry_statuses:
+                breaker.record_success()
+                raise error
 
-    @cached(ttl=3600)
+            breaker.record_failure()
+
+            if attempt == max_attempts:
+                raise error
+
+            delay = policy.next_delay(delay, retry_after)
+            await asyncio.sleep(delay)
+
+    @cached_response(ttl=3600)
     async def fetch_main_page(self) -> str:
         """Retrieves the platform's main page HTML content.
 
@@ -119,7 +162,7 @@ class Request(Generic[T]):
 
         return await response.text()
 
-    @cached(ttl=30)
+    @cached_response(ttl=30)
     async def fetch_users_page(self, account_id: int) -> str:
         """Fetches user profile page HTML by account ID.
 
@@ -139,7 +182,7 @@ class Request(Generic[T]):
 
         return await response.text()
 
-    @cached(ttl=30)
+    @cached_response(ttl=30)
     async def fetch_lots_page(self, game_id: int) -> str:
         """Retrieves lots page HTML for specific marketplace node.
 
@@ -177,6 +220,7 @@ class Request(Generic[T]):
             method='POST',
             url='/lots/raise',
             response_type=ResponseType.JSON,
+            priority=Priority.LOW,
             data={
                 "game_id": game_id,
                 "node_id": node_id
@@ -215,6 +259,7 @@ class Request(Generic[T]):
             method="POST",
             url="/runner/",
             response_type=ResponseType.JSON,
+            priority=Priority.HIGH,
             data={
                 "objects": json.dumps(objects),
                 "request": json.dumps(request),
@@ -264,6 +309,7 @@ class Request(Generic[T]):
             method="POST",
             url='/runner/',
             response_type=ResponseType.JSON,
+            idempotent=True,
             data={
                 "objects": json.dumps([orders, chats]),
                 "request": False,
@@ -353,7 +399,21 @@ class Request(Generic[T]):
         if isinstance(chat, dict):
             return chat
 
-    @cached(ttl=5)
+    async def fetch_chat_page(self) -> str:
+        """Fetches the HTML content of the chat list page.
+
+        Returns:
+            str: Raw HTML content of the chat list page.
+        """
+        response = await self._send_request(
+            method="GET",
+            url="/chat/",
+            response_type=ResponseType.TEXT
+        )
+
+        return await response.text()
+
+    @cached_response(ttl=5)
     async def fetch_purchases_page(self) -> str:
         """Fetches the HTML content of the user's purchases page.
 
@@ -371,7 +431,7 @@ class Request(Generic[T]):
 
         return await response.text()
 
-    @cached(ttl=5)
+    @cached_response(ttl=5)
     async def fetch_sales_page(self) -> str:
         """Fetches the HTML content of the user's sales page.
 
@@ -389,7 +449,29 @@ class Request(Generic[T]):
 
         return await response.text()
 
-    @cached(ttl=3600)
+    async def fetch_more_orders(self, url: Literal["/orders/trade", "/orders/"], continue_token: str) -> str:
+        """Fetches the next page of the sales or purchases list.
+
+        Args:
+            url: "/orders/trade" for sales, "/orders/" for purchases
+            continue_token: Value of the ``continue`` field of the previous page
+
+        Returns:
+            str: Raw HTML content with the next order rows.
+        """
+        # Only reads the order list, so repeating it is safe; it is counted as
+        # a page request like the GET of the first page
+        response = await self._send_request(
+            method="POST",
+            url=url,
+            response_type=ResponseType.TEXT,
+            idempotent=True,
+            data={"continue": continue_token}
+        )
+
+        return await response.text()
+
+    @cached_response(ttl=3600)
     async def fetch_order_page(self, order_code: str) -> str:
         """Fetches the HTML content of a specific order page.
 
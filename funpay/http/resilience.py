@@ -0,0 +1,130 @@
+from typing import Optional
+from email.utils import parsedate_to_datetime
+import datetime
+import random
+import time
+
+import aiohttp
+
+from .exceptions import CircuitOpenError
+
+
+class RetryPolicy:
+    """Deadline and retry settings for outgoing requests.
+
+    Only idempotent requests (page GETs and ``/runner/`` update polls) are retried.
+    Delays between attempts use decorrelated jitter, and a ``Retry-After`` header
+    sent by the server takes precedence.
+
+    Args:
+        timeout (float): Deadline for receiving a response, per attempt (seconds)
+        max_attempts (int): Total number of attempts including the first one
+        base_delay (float): Smallest delay between attempts
+        max_delay (float): Largest delay between attempts (also caps Retry-After)
+        retry_statuses (frozenset[int]): Response statuses that are retried
+    """
+
+    RETRY_EXCEPTIONS = (TimeoutError, aiohttp.ClientError)
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 30,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30,
+        retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    ):
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = retry_statuses
+
+    def next_delay(self, previous_delay: float, retry_after: Optional[float] = None) -> float:
+        """Returns the delay before the next attempt."""
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+
+        return min(self.max_delay, random.uniform(self.base_delay, max(previous_delay, self.base_delay) * 3))
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parses a Retry-After header given in seconds or as an HTTP date."""
+        if not value:
+            return None
+
+        if value.isdigit():
+            return float(value)
+
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        return max((date - datetime.datetime.now(tz=datetime.timezone.utc)).total_seconds(), 0.0)
+
+
+class CircuitBreaker:
+    """Stops sending requests while FunPay is failing and recovers automatically.
+
+    After ``failure_threshold`` consecutive failures (5xx, 429, timeouts, network
+    errors) the circuit opens and requests fail fast with CircuitOpenError. After
+    ``recovery_timeout`` one trial request is let through: success closes the
+    circuit, failure opens it again.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open the circuit
+        recovery_timeout (float): Seconds before a trial request is allowed
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, *, failure_threshold: int = 5, recovery_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_started_at = None
+
+    def before_request(self, url: str) -> None:
+        """Raises CircuitOpenError if the request must not be sent."""
+        if self.state == self.CLOSED:
+            return
+
+        remaining = self._opened_at + self.recovery_timeout - time.monotonic()
+
+        if self.state == self.OPEN and remaining <= 0:
+            self.state = self.HALF_OPEN
+
+        now = time.monotonic()
+        trial_expired = self._trial_started_at is None or now - self._trial_started_at > self.recovery_timeout
+
+        if self.state == self.HALF_OPEN and trial_expired:
+            self._trial_started_at = now
+            return
+
+        raise CircuitOpenError(url=url, retry_after=max(remaining, 0.0))
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_started_at = None
+
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures
+        }
@@ -0,0 +1,173 @@
+from typing import TYPE_CHECKING, Optional
+import sys
+
+from funpay.enums import HtmlBackend
+from funpay.executor import ParseExecutor
+
+if TYPE_CHECKING:
+    from funpay.enums import Locale, OrderType
+    from funpay.types import OrderCut
+
+
+def _parse_rows(rows: list[str], backend: 'HtmlBackend', locale: 'Locale', order_type: 'OrderType') -> list['OrderCut']:
+    from funpay.parsers.html import FunpayOrdersCutHtmlParser
+
+    if not rows:
+        return []
+
+    return FunpayOrdersCutHtmlParser(''.join(rows), backend=backend).parse(locale=locale, order_type=order_type)
+
+
+class OrderBook:
+    """In-memory index of the account's orders, updated incrementally.
+
+    The order pages list the newest orders first. An update cuts the rows out of
+    the page HTML and reads the status of every known row straight from its
+    HTML; only unknown rows and known rows whose status changed are parsed, all
+    in a single tree. Older orders change status too (a buyer confirms
+    yesterday's order), so every row on the page is checked.
+
+    Every stored change gets an increasing revision, so consumers can ask for
+    the orders that changed since the revision they saw last.
+
+    Args:
+        html_backend (HtmlBackend): Tree builder used to parse the order rows
+        executor (Optional[ParseExecutor]): Where the rows are parsed. If None,
+            they are parsed inline.
+
+    Attributes:
+        revision (int): Revision of the latest change (the current cursor)
+    """
+
+    def __init__(
+        self,
+        *,
+        html_backend: 'HtmlBackend' = HtmlBackend.HTML_PARSER,
+        executor: Optional['ParseExecutor'] = None
+    ):
+        self.html_backend = html_backend
+        self.executor = executor if executor else ParseExecutor()
+        self.revision = 0
+
+        self._orders: dict[str, 'OrderCut'] = {}
+        self._revisions: dict[str, int] = {}
+        self._positions: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def get(self, order_code: str) -> Optional['OrderCut']:
+        return self._orders.get(order_code.lstrip('#'))
+
+    def orders(self, order_type: Optional['OrderType'] = None) -> list['OrderCut']:
+        """Returns the stored orders newest first, optionally of one type."""
+        codes = sorted(self._orders, key=self._positions.__getitem__, reverse=True)
+
+        return [
+            self._orders[code] for code in codes
+            if order_type is None or self._orders[code].order_type == order_type
+        ]
+
+    def _store(self, code: str, order: 'OrderCut') -> None:
+        self.revision += 1
+
+        # Re-inserting keeps the dict ordered by revision for changed_since()
+        self._orders.pop(code, None)
+        self._orders[code] = order
+        self._revisions[code] = self.revision
+
+        if code not in self._positions:
+            self._positions[code] = len(self._positions)
+
+    async def update(
+        self,
+        html: str,
+        locale: 'Locale',
+        order_type: 'OrderType',
+        *,
+        full: bool = False
+    ) -> list['OrderCut']:
+        """Merges an orders page into the book.
+
+        Rows are cut and their statuses checked on the event loop (no tree is
+        built); the rows that need parsing go to the executor as plain strings.
+
+        Args:
+            html: HTML of the sales or purchases page
+            locale: Locale of the account
+            order_type: Type of the orders on the page
+            full: Parse every row, also known rows whose status did not change
+
+        Returns:
+            list[OrderCut]: New orders and orders whose status changed, newest first
+        """
+        from funpay.parsers.html import FunpayOrdersCutHtmlParser
+
+        rows = FunpayOrdersCutHtmlParser.split_rows(html)
+        pending = []
+        changed = {}
+
+        for index, (code, row) in enumerate(rows):
+            known = self._orders.get(code)
+
+            if full or not known or FunpayOrdersCutHtmlParser.row_status(row, locale) != known.status:
+                pending.append((index, code, row))
+
+        if pending:
+            parsed = await self.executor.call(
+                _parse_rows,
+                [row for _, _, row in pending],
+                self.html_backend,
+                locale,
+                order_type
+            )
+        else:
+            parsed = []
+
+        for (index, code, _), order in zip(pending, parsed):
+            known = self._orders.get(code)
+
+            if not known or known.status != order.status:
+                changed[index] = (code, order)
+
+        # Stored oldest first, so newer orders get higher positions and revisions
+        for index in sorted(changed, reverse=True):
+            self._store(*changed[index])
+
+        return [changed[index][1] for index in sorted(changed)]
+
+    def changed_since(self, cursor: int = 0) -> tuple[list['OrderCut'], int]:
+        """Returns the orders changed after ``cursor`` and the new cursor.
+
+        Args:
+            cursor: ``revision`` returned by the previous call (0 for everything)
+
+        Returns:
+            tuple[list[OrderCut], int]: Changed orders (oldest change first) and
+                the cursor to pass next time
+        """
+        changed = []
+
+        for code in reversed(self._orders):
+            if self._revisions[code] <= cursor:
+                break
+
+            changed.append(self._orders[code])
+
+        changed.reverse()
+        return changed, self.revision
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the stored orders and their indexes."""
+        return (
+            sys.getsizeof(self._orders) + sys.getsizeof(self._revisions) + sys.getsizeof(self._positions)
+            + sum(sys.getsizeof(order) + sys.getsizeof(order.title) for order in self._orders.values())
+        )
+
+    def stats(self) -> dict:
+        return {
+            "orders": len(self._orders),
+            "revision": self.revision,
+            "nbytes": self.nbytes
+        }
@@ -1,9 +1,45 @@
-from .base_html_parser import BaseHtmlParser
-from .user_parser import FunpayUserProfileHtmlParser
-from .main_parser import FunpayGamesHtmlParser, FunpayAccountHtmlParser
-from .message_parser import MessageHtmlParser
-from .review_parser import ReviewHtmlParser, FunpayUserReviewsHtmlParser
-from .lot_parser import LotHtmlParser, FunpayUserLotsHtmlParser
-from .order_parser import FunpayOrderHtmlParser, FunpayOrdersCutHtmlParser
+from typing import TYPE_CHECKING
 
+from funpay.utils import lazy_attributes
 
+if TYPE_CHECKING:
+    from .base_html_parser import BaseHtmlParser
+    from .user_parser import FunpayUserProfileHtmlParser
+    from .main_parser import FunpayGamesHtmlParser, FunpayAccountHtmlParser
+    from .message_parser import MessageHtmlParser
+    from .review_parser import ReviewHtmlParser, FunpayUserReviewsHtmlParser
+    from .lot_parser import LotHtmlParser, FunpayUserLotsHtmlParser
+    from .order_parser import FunpayOrderHtmlParser, FunpayOrdersCutHtmlParser
+    from .chat_parser import FunpayChatBookmarksHtmlParser, FunpayChatCutsHtmlParser
+
+__all__ = [
+    "BaseHtmlParser",
+    "FunpayUserProfileHtmlParser",
+    "FunpayGamesHtmlParser",
+    "FunpayAccountHtmlParser",
+    "MessageHtmlParser",
+    "ReviewHtmlParser",
+    "FunpayUserReviewsHtmlParser",
+    "LotHtmlParser",
+    "FunpayUserLotsHtmlParser",
+    "FunpayOrderHtmlParser",
+    "FunpayOrdersCutHtmlParser",
+    "FunpayChatBookmarksHtmlParser",
+    "FunpayChatCutsHtmlParser"
+]
+
+__getattr__ = lazy_attributes(__name__, {
+    "BaseHtmlParser": ".base_html_parser",
+    "FunpayUserProfileHtmlParser": ".user_parser",
+    "FunpayGamesHtmlParser": ".main_parser",
+    "FunpayAccountHtmlParser": ".main_parser",
+    "MessageHtmlParser": ".message_parser",
+    "ReviewHtmlParser": ".review_parser",
+    "FunpayUserReviewsHtmlParser": ".review_parser",
+    "LotHtmlParser": ".lot_parser",
+    "FunpayUserLotsHtmlParser": ".lot_parser",
+    "FunpayOrderHtmlParser": ".order_parser",
+    "FunpayOrdersCutHtmlParser": ".order_parser",
+    "FunpayChatBookmarksHtmlParser": ".chat_parser",
+    "FunpayChatCutsHtmlParser": ".chat_parser"
+})
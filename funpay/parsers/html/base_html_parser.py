@@ -1,12 +1,10 @@
-from typing import TYPE_CHECKING, Type, Any
+from typing import Type, Any, Union
 from functools import cached_property
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from funpay.parsers import ABCParser
-
-if TYPE_CHECKING:
-    from bs4 import Tag
+from funpay.enums import HtmlBackend
 
 
 class BaseHtmlParser(ABCParser):
@@ -21,23 +19,34 @@ class BaseHtmlParser(ABCParser):
         BaseParser: Abstract parser interface
 
     Args:
-        html (str): Raw HTML content to parse
+        html (str | Tag): Raw HTML content to parse, or an already parsed
+            node of a parent document (no re-parsing is performed)
+        backend (HtmlBackend): Tree builder used by BeautifulSoup
+            (default: the built-in ``html.parser``, ``lxml`` requires lxml installed)
 
     Attributes:
-        html (str): Original HTML content
+        html (str | Tag): Original HTML content
+        backend (HtmlBackend): Selected tree builder
     """
-    def __init__(self, html: str):
+    def __init__(self, html: Union[str, 'Tag'], *, backend: 'HtmlBackend' = HtmlBackend.HTML_PARSER):
         super().__init__(html)
         self.html = html
+        self.backend = HtmlBackend(backend)
 
-    @property
-    def soup(self) -> 'BeautifulSoup':
+    @cached_property
+    def soup(self) -> Union['BeautifulSoup', 'Tag']:
         """BeautifulSoup document representation (cached).
 
+        The document is built once per parser instance. When the parser was
+        created from a ``Tag`` of a parent document, that node is used as is.
+
         Returns:
-            BeautifulSoup: Parsed document tree
+            BeautifulSoup | Tag: Parsed document tree
         """
-        return BeautifulSoup(self.html, 'html.parser')
+        if isinstance(self.html, Tag):
+            return self.html
+
+        return BeautifulSoup(self.html, self.backend.value)
 
     @staticmethod
     def get_text(element: 'Tag', selector: str, to_type: Type[Any] = str) -> str:
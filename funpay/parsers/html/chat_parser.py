@@ -0,0 +1,60 @@
+from typing import TYPE_CHECKING
+
+from funpay.types import ChatCut, Message
+from .base_html_parser import BaseHtmlParser
+
+if TYPE_CHECKING:
+    from bs4 import Tag
+
+
+class FunpayChatBookmarksHtmlParser(BaseHtmlParser):
+    """Parser for get last message ids of chats from runner object:
+       - chat_bookmarks (https://funpay.com/runner/)
+    """
+
+    def _extract_contact_items(self) -> list['Tag']:
+        return self.soup.find_all("a", {"class": "contact-item"})
+
+    def _parse_implementation(self) -> dict[int, int]:
+        last_messages = {}
+
+        for contact_item in self._extract_contact_items():
+            last_messages[int(contact_item['data-id'])] = int(contact_item['data-node-msg'])
+
+        return last_messages
+
+
+class FunpayChatCutsHtmlParser(FunpayChatBookmarksHtmlParser):
+    """Parser for get chat list with last messages from:
+       - https://funpay.com/chat/
+       - chat_bookmarks (https://funpay.com/runner/)
+
+    Note:
+        The chat list shows neither the author nor the date of the last
+        message, so ``author`` and ``date`` of ``ChatCut.last_message`` are None.
+    """
+
+    def _parse_implementation(self) -> list['ChatCut']:
+        chats = []
+
+        for contact_item in self._extract_contact_items():
+            chat_id = int(contact_item['data-id'])
+            avatar = contact_item.find("div", {"class": "avatar-photo"})
+            interlocutor_id = int(avatar['data-href'].split('/')[-2]) if avatar and avatar.get('data-href') else None
+
+            last_message = Message(
+                id=int(contact_item['data-node-msg']),
+                chat_id=chat_id,
+                content=self.get_text(contact_item, "div.contact-item-message"),
+                author=None,
+                date=None
+            )
+
+            chats.append(ChatCut(
+                id=chat_id,
+                interlocutor_id=interlocutor_id,
+                last_message=last_message,
+                unread="unread" in contact_item.get("class", ())
+            ))
+
+        return chats
@@ -54,7 +54,7 @@ class FunpayUserLotsHtmlParser(BaseHtmlParser):
         lots = []
 
         for offer in offers_soup:
-            lot = LotHtmlParser(str(offer)).parse()
+            lot = LotHtmlParser(offer).parse()
 
             if not lot or node_id and node_id != lot.node.id:
                 continue
@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING, Optional
 
+from bs4 import Tag
+
 from funpay.types import Message, UserCut
 from funpay.utils import string_to_datetime
 
@@ -7,7 +9,6 @@ from .base_html_parser import BaseHtmlParser
 
 if TYPE_CHECKING:
     import datetime
-    from bs4 import Tag
     from funpay.enums import Locale
 
 
@@ -15,8 +16,23 @@ class MessageHtmlParser(BaseHtmlParser):
     """Parser for get message from raw html string"""
 
     def _extract_message_container(self) -> 'Tag':
+        if "chat-msg-item" in self.soup.get("class", ()):
+            return self.soup
+
         return self.soup.find("div", {"class": "chat-msg-item"})
 
+    @staticmethod
+    def _index_divs(container: 'Tag') -> dict[str, 'Tag']:
+        """Maps every class name to the first ``div`` carrying it in one walk of the tree."""
+        divs = {}
+
+        for element in container.descendants:
+            if isinstance(element, Tag) and element.name == "div":
+                for class_name in element.get("class", ()):
+                    divs.setdefault(class_name, element)
+
+        return divs
+
     def _parse_implementation(
         self,
         chat_id: int,
@@ -26,10 +42,13 @@ class MessageHtmlParser(BaseHtmlParser):
     ) -> 'Message':
 
         message_container = self._extract_message_container()
+        divs = self._index_divs(message_container)
+
         message_id = int(message_container['id'].split('-')[1])
-        content = self.get_text(message_container, "div.chat-msg-text")
+        chat_msg_text = divs.get("chat-msg-text")
+        content = chat_msg_text.text.strip() if chat_msg_text else None
 
-        chat_msg_date = message_container.find("div", {"class": "chat-msg-date"})
+        chat_msg_date = divs.get("chat-msg-date")
 
         if chat_msg_date:
             date = string_to_datetime(
@@ -37,7 +56,7 @@ class MessageHtmlParser(BaseHtmlParser):
                 datetime_string=chat_msg_date['title']
             )
 
-        media_user_name = message_container.find("div", {"class": "media-user-name"})
+        media_user_name = divs.get("media-user-name")
 
         if media_user_name:
             author_label = media_user_name.find("span", {"class": "chat-msg-author-label"})
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+import re
 
 from funpay.enums import Locale, OrderType
 from funpay.types import Order, OrderCut, UserCut, Node
@@ -8,6 +9,7 @@ from .base_html_parser import BaseHtmlParser
 
 if TYPE_CHECKING:
     from bs4 import Tag
+    from funpay.enums import StatusOrder
 
 
 class FunpayOrderHtmlParser(BaseHtmlParser):
@@ -142,14 +144,57 @@ class FunpayOrdersCutHtmlParser(BaseHtmlParser):
        - https://funpay.com/orders/trade
        - https://funpay.com/orders/
     """
+    _ROW_PATTERN = re.compile(r'<a\b[^>]*\bclass="tc-item\b[^>]*>')
+    _CODE_PATTERN = re.compile(r'/orders/([^/"]+)/')
+    _STATUS_PATTERN = re.compile(r'<div class="tc-status\b[^"]*">\s*([^<]*?)\s*</div>')
+
+    @classmethod
+    def split_rows(cls, html: str) -> list[tuple[str, str]]:
+        """Cuts the order rows out of the page without building a tree.
+
+        Returns:
+            list[tuple[str, str]]: ``(order code, row HTML)`` pairs in page order
+        """
+        rows = []
+
+        for match in cls._ROW_PATTERN.finditer(html):
+            code = cls._CODE_PATTERN.search(match.group())
+            end = html.find("</a>", match.end())
+
+            if not code or end == -1:
+                continue
+
+            rows.append((code.group(1), html[match.start():end + 4]))
+
+        return rows
+
+    @classmethod
+    def row_status(cls, row: str, locale: 'Locale') -> Optional['StatusOrder']:
+        """Reads the status of a row cut by ``split_rows`` without building a tree."""
+        match = cls._STATUS_PATTERN.search(row)
+
+        if not match:
+            return None
+
+        return get_order_status_from_string(locale=locale, status_string=match.group(1))
+
     def _extract_orders(self) -> list['Tag']:
         return self.soup.find_all("a", {"class": "tc-item"})
 
+    def continue_token(self) -> Optional[str]:
+        """Returns the token of the next page, or None on the last page."""
+        continue_input = self.soup.find("input", {"type": "hidden", "name": "continue"})
+
+        if not continue_input:
+            return None
+
+        return continue_input.get("value") or None
+
     def _parse_implementation(self, locale: 'Locale', order_type: 'OrderType') -> list['OrderCut']:
         orders_soup = self._extract_orders()
 
         orders = [
-            OrderCutHtmlParser(str(order_soup)).parse(
+            OrderCutHtmlParser(order_soup).parse(
                 locale=locale,
                 order_type=order_type
             )
@@ -9,6 +9,9 @@ if TYPE_CHECKING:
 
 class ReviewHtmlParser(BaseHtmlParser):
     def _extract_review_container(self) -> 'Tag':
+        if "review-container" in self.soup.get("class", ()):
+            return self.soup
+
         return self.soup.find("div", {"class": "review-container"})
 
     def _extract_media_user_name(self) -> 'Tag':
@@ -54,7 +57,7 @@ class FunpayUserReviewsHtmlParser(BaseHtmlParser):
         reviews = []
 
         for review_container in review_containers:
-            review = ReviewHtmlParser(str(review_container)).parse()
+            review = ReviewHtmlParser(review_container).parse()
             if not review or only_user_id and review.user_id != 0 and review.user_id != only_user_id:
                 continue
 
@@ -1,4 +1,16 @@
-from .raise_node_parser import RaiseNodeJsonParser
-from .runner_parser import RunnerMessageJsonParser
-from .chat_parser import ChatJsonParser
+from typing import TYPE_CHECKING
 
+from funpay.utils import lazy_attributes
+
+if TYPE_CHECKING:
+    from .raise_node_parser import RaiseNodeJsonParser
+    from .runner_parser import RunnerMessageJsonParser
+    from .chat_parser import ChatJsonParser
+
+__all__ = ["RaiseNodeJsonParser", "RunnerMessageJsonParser", "ChatJsonParser"]
+
+__getattr__ = lazy_attributes(__name__, {
+    "RaiseNodeJsonParser": ".raise_node_parser",
+    "RunnerMessageJsonParser": ".runner_parser",
+    "ChatJsonParser": ".chat_parser"
+})
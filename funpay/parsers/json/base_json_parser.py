@@ -1,12 +1,14 @@
 from typing import Any
 
 from funpay.parsers import ABCParser
+from funpay.enums import HtmlBackend
 
 
 class BaseJsonParser(ABCParser):
-    def __init__(self, data: dict | list):
+    def __init__(self, data: dict | list, *, backend: 'HtmlBackend' = HtmlBackend.HTML_PARSER):
         super().__init__(data)
         self.data = data
+        self.backend = HtmlBackend(backend)
 
     def _parse_implementation(self, **kwargs) -> Any:
         raise NotImplementedError
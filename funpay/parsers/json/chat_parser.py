@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+
+from bs4 import BeautifulSoup
 
 from funpay.types import Chat
 from funpay.parsers.html import MessageHtmlParser
@@ -7,7 +9,9 @@ from .base_json_parser import BaseJsonParser
 
 if TYPE_CHECKING:
     import datetime
+    from bs4 import Tag
     from funpay.enums import Locale
+    from funpay.types import UserCut
 
 
 class ChatJsonParser(BaseJsonParser):
@@ -19,7 +23,33 @@ class ChatJsonParser(BaseJsonParser):
     def _extract_messages(self) -> dict:
         return self.data.get('messages')
 
-    def _parse_implementation(self, locale: 'Locale', since_date: 'datetime.datetime') -> 'Chat':
+    def _build_message_fragments(self, raw_messages: list[dict]) -> list['Tag']:
+        """Parses the HTML of all messages as one document.
+
+        Every fragment is wrapped in its own container, so a page of messages
+        needs a single BeautifulSoup tree instead of one tree per message.
+        """
+        html = ''.join(f'<div class="chat-msg-fragment">{raw_message["html"]}</div>' for raw_message in raw_messages)
+        soup = BeautifulSoup(html, self.backend.value)
+
+        return soup.find_all("div", {"class": "chat-msg-fragment"})
+
+    def _parse_implementation(
+        self,
+        locale: 'Locale',
+        since_date: Optional['datetime.datetime'] = None,
+        after_message_id: Optional[int] = None,
+        author: Optional['UserCut'] = None,
+        date: Optional['datetime.datetime'] = None
+    ) -> 'Chat':
+        """Parses the chat page.
+
+        Args:
+            after_message_id: Messages with this id or lower are skipped without
+                parsing their HTML
+            author: Author of the message preceding the first parsed one
+            date: Date of the message preceding the first parsed one
+        """
         node = self._extract_node()
 
         if not node:
@@ -28,12 +58,15 @@ class ChatJsonParser(BaseJsonParser):
         chat_id = node['id']
         interlocutor_id = int(node['name'].split('-')[1])
 
-        messages_raw_list = self._extract_messages()
-        last_author, last_date = None, None
+        messages_raw_list = [
+            raw_message for raw_message in self._extract_messages()
+            if not (after_message_id and 'id' in raw_message and int(raw_message['id']) <= after_message_id)
+        ]
+        last_author, last_date = author, date
         messages = []
 
-        for raw_message in messages_raw_list:
-            message = MessageHtmlParser(raw_message['html']).parse(
+        for fragment in self._build_message_fragments(messages_raw_list):
+            message = MessageHtmlParser(fragment, backend=self.backend).parse(
                 chat_id=chat_id,
                 locale=locale,
                 author=last_author,
@@ -54,4 +87,3 @@ class ChatJsonParser(BaseJsonParser):
             interlocutor_id=interlocutor_id,
             messages=messages
         )
-
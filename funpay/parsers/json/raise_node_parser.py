@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from funpay.types import RaiseNode
+from funpay.utils import get_cooldown_from_string
 from .base_json_parser import BaseJsonParser
 
 if TYPE_CHECKING:
@@ -11,8 +12,12 @@ class RaiseNodeJsonParser(BaseJsonParser):
     """Parser to retrieve raised nodes from link https://funpay.com/lots/raise"""
 
     def _parse_implementation(self, node: 'Node') -> 'RaiseNode':
+        message = self.data.get('msg')
+        success = not bool(self.data.get('error'))
+
         return RaiseNode(
             node=node,
-            message=self.data.get('msg'),
-            success=not bool(self.data.get('error'))
+            message=message,
+            success=success,
+            cooldown=None if success else get_cooldown_from_string(message)
         )
\ No newline at end of file
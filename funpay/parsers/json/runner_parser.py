@@ -1,6 +1,6 @@
 import datetime
 
-from funpay.types import Message
+from funpay.types import Message, UserCut
 from funpay.parsers.html import MessageHtmlParser
 from funpay.enums import Locale
 
@@ -26,9 +26,9 @@ class RunnerMessageJsonParser(BaseJsonParser):
         chat_id = data['node']['id']
         last_message = data['messages'][-1]
 
-        return MessageHtmlParser(last_message['html']).parse(
+        return MessageHtmlParser(last_message['html'], backend=self.backend).parse(
             chat_id=chat_id,
             locale=locale,
             date=datetime.datetime.now(tz=datetime.timezone.utc),
-            author_id=author_id
+            author=UserCut(id=author_id, username=None)
         )
\ No newline at end of file
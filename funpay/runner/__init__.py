@@ -1 +1,4 @@
 from .runner import Runner
+from .scheduler import PollScheduler
+from .supervisor import Supervisor
+from .bump_scheduler import BumpScheduler
@@ -0,0 +1,130 @@
+from typing import TYPE_CHECKING
+import logging
+import asyncio
+import heapq
+import time
+
+from funpay.http.exceptions import HttpRequestError, NetworkError, CircuitOpenError
+
+if TYPE_CHECKING:
+    from funpay import FunpayAPI
+    from funpay.types import Node, RaiseNode
+
+
+class BumpScheduler:
+    """Raises the account's nodes in the background as soon as their cooldown ends.
+
+    Keeps a min-heap of per-node raise deadlines learned from the raise
+    responses and sleeps exactly until the earliest one. After a successful
+    raise FunPay does not report the next cooldown, so the node is probed again
+    after ``probe_interval``; the probe answer contains the exact wait time.
+
+    Every node has at most one live deadline: rescheduling a node leaves its
+    old heap entry behind, and such stale entries are skipped when popped.
+
+    Args:
+        api (FunpayAPI): Account whose lots are raised
+        probe_interval (float): Delay before re-checking a node with unknown cooldown
+        refresh_interval (float): How often the list of nodes with active lots is re-read
+    """
+
+    def __init__(self, api: 'FunpayAPI', *, probe_interval: float = 60, refresh_interval: float = 600):
+        self.api = api
+        self.probe_interval = probe_interval
+        self.refresh_interval = refresh_interval
+        self.logging = logging.getLogger('funpay.BumpScheduler')
+
+        self._nodes: dict[int, 'Node'] = {}
+        self._deadlines = list[tuple[float, int]]()
+        self._deadline_of: dict[int, float] = {}
+        self._next_refresh = 0.0
+
+        self.raised = 0
+        self.skipped = 0
+
+    def _schedule(self, node_id: int, deadline: float) -> None:
+        self._deadline_of[node_id] = deadline
+        heapq.heappush(self._deadlines, (deadline, node_id))
+
+    def _is_live(self, deadline: float, node_id: int) -> bool:
+        return self._deadline_of.get(node_id) == deadline
+
+    def _discard_stale(self) -> None:
+        while self._deadlines and not self._is_live(*self._deadlines[0]):
+            heapq.heappop(self._deadlines)
+
+    async def _refresh_nodes(self) -> None:
+        lots = await self.api.lots.all()
+        nodes = {lot.node.id: lot.node for lot in lots}
+
+        for node_id in self._nodes.keys() - nodes.keys():
+            self._deadline_of.pop(node_id, None)
+
+        for node_id in nodes.keys() - self._nodes.keys():
+            self._schedule(node_id, self.api.bump_engine.next_eligible(node_id))
+
+        self._nodes = nodes
+        self._next_refresh = time.monotonic() + self.refresh_interval
+
+    def _reschedule(self, result: 'RaiseNode') -> None:
+        if result.success:
+            self.raised += 1
+            self.logging.info(f"Raised Node={result.node.id}")
+        else:
+            self.skipped += 1
+
+        if result.node.id in self._nodes:
+            delay = result.cooldown if result.cooldown else self.probe_interval
+            self._schedule(result.node.id, time.monotonic() + delay)
+
+    async def run(self) -> None:
+        while True:
+            if time.monotonic() >= self._next_refresh:
+                try:
+                    if not self.api.account:
+                        await self.api.login()
+
+                    await self._refresh_nodes()
+                except (HttpRequestError, NetworkError, CircuitOpenError) as e:
+                    self.logging.warning(f"Refreshing nodes failed: {e}")
+                    self._next_refresh = time.monotonic() + self.probe_interval
+
+            now = time.monotonic()
+            due = set[int]()
+
+            while self._deadlines and self._deadlines[0][0] <= now:
+                deadline, node_id = heapq.heappop(self._deadlines)
+
+                if self._is_live(deadline, node_id):
+                    del self._deadline_of[node_id]
+                    due.add(node_id)
+
+            if due:
+                try:
+                    results = await self.api.bump_engine.raise_nodes(self._nodes[node_id] for node_id in due)
+                except (HttpRequestError, NetworkError, CircuitOpenError) as e:
+                    self.logging.warning(f"Raise failed: {e}")
+
+                    for node_id in due:
+                        self._schedule(node_id, time.monotonic() + self.probe_interval)
+                except Exception:
+                    # The due nodes already left the schedule; put them back before anything else
+                    self.logging.exception(f"Raise of Nodes={sorted(due)} failed")
+
+                    for node_id in due:
+                        self._schedule(node_id, time.monotonic() + self.probe_interval)
+                else:
+                    for result in results:
+                        self._reschedule(result)
+
+            self._discard_stale()
+            wake_at = min(self._deadlines[0][0] if self._deadlines else self._next_refresh, self._next_refresh)
+            await asyncio.sleep(max(wake_at - time.monotonic(), 0))
+
+    def stats(self) -> dict:
+        return {
+            "nodes": len(self._nodes),
+            "next_raise_in": max(min(self._deadline_of.values()) - time.monotonic(), 0.0) if self._deadline_of else None,
+            "raised": self.raised,
+            "skipped": self.skipped
+        }
@@ -0,0 +1,3 @@
+from .base import BaseEvent
+from .chat import NewMessage
+from .orders import NewOrder, OrderStatusChanged
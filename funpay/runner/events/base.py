@@ -0,0 +1,14 @@
+from typing import ClassVar
+from dataclasses import dataclass
+
+from funpay.enums import EventType
+
+
+@dataclass(frozen=True)
+class BaseEvent:
+    """Base class for typed events emitted by the Runner.
+
+    Class Attributes:
+        event_type (EventType): Listener group the event is delivered to
+    """
+    event_type: ClassVar['EventType']
@@ -0,0 +1,15 @@
+from typing import TYPE_CHECKING
+from dataclasses import dataclass
+
+from funpay.enums import EventType
+from .base import BaseEvent
+
+if TYPE_CHECKING:
+    from funpay.types import Message
+
+
+@dataclass(frozen=True)
+class NewMessage(BaseEvent):
+    event_type = EventType.CHAT
+
+    message: 'Message'
@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+from dataclasses import dataclass
+
+from funpay.enums import EventType
+from .base import BaseEvent
+
+if TYPE_CHECKING:
+    from funpay.types import OrderCut
+    from funpay.enums import StatusOrder
+
+
+@dataclass(frozen=True)
+class NewOrder(BaseEvent):
+    event_type = EventType.ORDER
+
+    order: 'OrderCut'
+
+
+@dataclass(frozen=True)
+class OrderStatusChanged(BaseEvent):
+    event_type = EventType.ORDER
+
+    order: 'OrderCut'
+    old: 'StatusOrder'
+    new: 'StatusOrder'
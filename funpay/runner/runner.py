@@ -1,32 +1,75 @@
-from typing import TYPE_CHECKING, Callable, Awaitable
-from functools import wraps
+from typing import TYPE_CHECKING, Callable, Awaitable, Optional
+from collections import deque
+import contextlib
+import functools
 import logging
 import asyncio
+import time
 
 from funpay.utils import random_tag
-from funpay.enums import EventType
+from funpay.enums import EventType, OrderType
+from funpay.parsers.html import FunpayChatBookmarksHtmlParser
+from funpay.http.exceptions import HttpRequestError, NetworkError, CircuitOpenError
+from funpay.executor import LoopLagMonitor
+from .events import BaseEvent, NewMessage, NewOrder, OrderStatusChanged
+from .scheduler import PollScheduler
+from .bump_scheduler import BumpScheduler
 from .exceptions import ListenerError
 
 if TYPE_CHECKING:
     from funpay import FunpayAPI
+    from funpay.enums import StatusOrder
 
 
-class _SingletonMeta(type):
-    _instance = None
+class Runner:
+    """Polls FunPay for updates and dispatches them to registered listeners.
 
-    def __call__(cls, *args, **kwargs):
-        if not cls._instance:
-            cls._instance = super().__call__(*args, **kwargs)
+    A single poll loop sends one ``/runner/`` request per tick and fans the
+    result out to every subscribed listener through its own queue, so the
+    number of requests does not grow with the number of listeners.
 
-        return cls._instance
+    The runner keeps the last message id of every chat and the status of every
+    sale, and listeners receive only the differences as typed events:
+    - chat: NewMessage
+    - order: NewOrder, OrderStatusChanged
 
+    Chat history and the sales page are fetched only when the corresponding
+    ``/runner/`` object changes. The first update only records the current state.
 
-class Runner(metaclass=_SingletonMeta):
-    def __init__(self, api: 'FunpayAPI'):
+    Args:
+        api (FunpayAPI): Authenticated (or lazily authenticated) API instance
+        scheduler (Optional[PollScheduler]): Adaptive poll interval. If None, a default
+            scheduler is created with the smallest listener interval as its base interval.
+
+    Attributes:
+        poll_limiter (Optional[asyncio.Semaphore]): Limits concurrent polls when several
+            runners share one event loop (set by Supervisor)
+        loop_lag (LoopLagMonitor): Measures event loop lag while the runner is running
+            (shared by all runners of a Supervisor)
+    """
+
+    _OBJECT_EVENTS = {
+        "chat_bookmarks": EventType.CHAT,
+        "orders_counters": EventType.ORDER
+    }
+
+    _RESTART_DELAY = 5
+
+    # Smallest listener interval; faster bursts are configured on PollScheduler(min_interval=...)
+    _MIN_INTERVAL = 6
+
+    def __init__(self, api: 'FunpayAPI', *, scheduler: Optional['PollScheduler'] = None):
         self.api = api
+        self.scheduler = scheduler
+        self.poll_limiter: Optional[asyncio.Semaphore] = None
+        self.loop_lag = LoopLagMonitor()
         self.logging = logging.getLogger('funpay.Runner')
 
-        self._listeners = {}
+        self._latencies = deque[float](maxlen=100)
+
+        self._listeners = list[tuple['EventType', Callable[..., Awaitable], asyncio.Queue]]()
+        self._interval = None
+        self._bump_scheduler: Optional['BumpScheduler'] = None
         self._tasks = set[asyncio.Task]()
         self._is_running = False
         self._stop_event = asyncio.Event()
@@ -35,79 +78,257 @@ class Runner(metaclass=_SingletonMeta):
         self._last_message_event_tag = random_tag()
         self._last_order_event_tag = random_tag()
 
-        self._saved_orders = []
-        self._last_messages = {}
+        self._saved_orders: Optional[dict[str, 'StatusOrder']] = None
+        self._order_cursor = 0
+        self._last_messages: Optional[dict[int, int]] = None
 
     async def _get_updates(self) -> dict:
-        updates = await self.api.client.request.fetch_updates(
-            account_id=self.api.account.id,
-            last_order_event_tag=self._last_order_event_tag,
-            last_message_event_tag=self._last_message_event_tag,
-            csrf_token=self.api.account.csrf_token
-        )
+        async with self.poll_limiter or contextlib.nullcontext():
+            started = time.monotonic()
+            updates = await self.api.client.request.fetch_updates(
+                account_id=self.api.account.id,
+                last_order_event_tag=self._last_order_event_tag,
+                last_message_event_tag=self._last_message_event_tag,
+                csrf_token=self.api.account.csrf_token
+            )
+            self._latencies.append(time.monotonic() - started)
 
-        events = []
+        return updates
+
+    def _save_tags(self, updates: dict) -> None:
+        """Moves the event tags forward; called only after the events of the update were built."""
         for obj in updates['objects']:
             if obj.get("type") == "chat_bookmarks":
                 self._last_message_event_tag = obj.get('tag', random_tag())
             elif obj.get("type") == "orders_counters":
                 self._last_order_event_tag = obj.get('tag', random_tag())
 
-        return updates
+    def _is_subscribed(self, event_name: 'EventType') -> bool:
+        return any(listener_event == event_name for listener_event, _, _ in self._listeners)
+
+    async def _get_chat_events(self, obj: dict) -> tuple[list['BaseEvent'], Callable[[], None]]:
+        """Compares chat bookmarks with the saved last message ids and fetches only changed chats.
+
+        Returns:
+            The events and a callback saving the new state once all events are built
+        """
+        html = (obj.get('data') or {}).get('html')
+
+        if not html:
+            return [], lambda: None
+
+        bookmarks = await self.api.parse_executor.parse(
+            FunpayChatBookmarksHtmlParser,
+            html,
+            backend=self.api.html_backend
+        )
+
+        def save() -> None:
+            if self._last_messages is None:
+                self._last_messages = {}
+
+            self._last_messages.update(bookmarks)
+
+        if self._last_messages is None:
+            return [], save
+
+        changed = {
+            chat_id: self._last_messages.get(chat_id, 0)
+            for chat_id, last_message_id in bookmarks.items()
+            if last_message_id > self._last_messages.get(chat_id, 0)
+        }
+
+        chats = await asyncio.gather(*(self.api.chat.get_history(chat_id) for chat_id in changed))
+
+        events = [
+            NewMessage(message=message)
+            for last_message_id, chat in zip(changed.values(), chats) if chat
+            for message in chat.messages
+            if message.id > last_message_id
+        ]
+
+        return events, save
+
+    async def _get_order_events(self) -> tuple[list['BaseEvent'], Callable[[], None]]:
+        """Compares the orders changed in the order book with the saved ones.
+
+        Returns:
+            The events and a callback saving the new state once all events are built
+        """
+        self.api.client.cache.invalidate("fetch_sales_page")
+        await self.api.orders.sync_sales()
+        orders, cursor = self.api.orders.changed_since(self._order_cursor)
+        statuses = {order.id: order.status for order in orders if order.order_type == OrderType.SALE}
+
+        def save() -> None:
+            self._order_cursor = cursor
+
+            if self._saved_orders is None:
+                self._saved_orders = {}
+
+            self._saved_orders.update(statuses)
+
+        if self._saved_orders is None:
+            return [], save
+
+        events = []
+
+        for order in orders:
+            if order.id not in statuses:
+                continue
+
+            saved_status = self._saved_orders.get(order.id)
+
+            if saved_status is None:
+                events.append(NewOrder(order=order))
+            elif saved_status != order.status:
+                events.append(OrderStatusChanged(order=order, old=saved_status, new=order.status))
+
+        return events, save
+
+    async def _get_events(self, updates: dict) -> list['BaseEvent']:
+        """Builds the events of an update and only then saves the new state and tags.
+
+        If fetching a chat or the sales page fails, nothing is saved, so the
+        same changes are picked up again by the next poll.
+        """
+        events = []
+        saves = []
+
+        for obj in updates.get('objects', []):
+            event_name = self._OBJECT_EVENTS.get(obj.get("type"))
+
+            if not event_name or not self._is_subscribed(event_name):
+                continue
+
+            if event_name == EventType.CHAT:
+                object_events, save = await self._get_chat_events(obj)
+            elif event_name == EventType.ORDER:
+                # The sales page is fetched only when the order counters changed
+                if obj.get('tag') == self._last_order_event_tag and self._saved_orders is not None:
+                    continue
+
+                object_events, save = await self._get_order_events()
+
+            events.extend(object_events)
+            saves.append(save)
+
+        for save in saves:
+            save()
+
+        self._save_tags(updates)
+        return events
+
+    def _dispatch(self, events: list['BaseEvent']) -> None:
+        """Puts every event into the queues of the listeners subscribed to its type."""
+        for event in events:
+            for event_name, _, queue in self._listeners:
+                if event_name == event.event_type:
+                    queue.put_nowait(event)
+
+    async def _poll(self) -> None:
+        while True:
+            if not self.api.account:
+                await self.api.login()
+
+            try:
+                updates = await self._get_updates()
+                events = await self._get_events(updates)
+            except (HttpRequestError, NetworkError, CircuitOpenError) as e:
+                self.logging.warning(f"Polling failed: {e}")
+                self.scheduler.on_error(getattr(e, 'retry_after', None))
+            else:
+                self._dispatch(events)
+
+                if events:
+                    self.scheduler.on_activity()
+                else:
+                    self.scheduler.on_idle()
+
+            await asyncio.sleep(self.scheduler.next_delay())
+
+    async def _consume(self, func: Callable[..., Awaitable], queue: asyncio.Queue) -> None:
+        while True:
+            event = await queue.get()
+
+            try:
+                await func(event)
+            except Exception:
+                self.logging.exception(f"Listener={func.__name__}() failed on {event!r}")
 
     def listener(self, event_name: EventType | str, *, interval: int = 6):
         if isinstance(event_name, str):
             event_name = EventType(event_name)
 
-        if interval < 6:
-            raise ListenerError("The interval is too small. Must be >=6")
+        if interval < self._MIN_INTERVAL:
+            raise ListenerError(f"The interval is too small. Must be >={self._MIN_INTERVAL}")
 
         def decorator(func: Callable[..., Awaitable]):
-            @wraps(func)
-            async def wrapper():
-                self.logging.info(
-                    f"SET Listener={func.__name__}() "
-                    f"Event={event_name} "
-                    f"Interval={interval}"
-                )
+            self.logging.info(
+                f"SET Listener={func.__name__}() "
+                f"Event={event_name} "
+                f"Interval={interval}"
+            )
 
-                while True:
-                    if not self.api.account:
-                        await self.api.login()
+            self._listeners.append((event_name, func, asyncio.Queue()))
+            self._interval = min(interval, self._interval or interval)
+            return func
 
-                    get_updates = await self._get_updates()
+        return decorator
 
-                    if get_updates.get('objects'):
-                        if event_name == EventType.ORDER:
-                            pass
+    def auto_bump(self, *, probe_interval: float = 60, refresh_interval: float = 600) -> 'BumpScheduler':
+        """Raises the account's lots in the background whenever a node's cooldown ends.
 
-                        await func(update=get_updates)
+        Args:
+            probe_interval: Delay before re-checking a node with unknown cooldown
+            refresh_interval: How often the list of nodes with active lots is re-read
 
-                    await asyncio.sleep(interval)
+        Returns:
+            BumpScheduler: The scheduler started together with the runner
+        """
+        self._bump_scheduler = BumpScheduler(
+            self.api,
+            probe_interval=probe_interval,
+            refresh_interval=refresh_interval
+        )
 
-            self._listeners[event_name] = wrapper
-            return wrapper
+        return self._bump_scheduler
 
-        return decorator
-
-    @staticmethod
-    async def _run_listener(listener: Callable[..., Awaitable]) -> None:
-        try:
-            await listener()
-        except asyncio.CancelledError:
-            return
-        except Exception as e:
-            raise e
+    async def _run_listener(self, factory: Callable[[], Awaitable]) -> None:
+        """Runs a background loop and restarts it after ``_RESTART_DELAY`` if it fails."""
+        while True:
+            try:
+                await factory()
+                return
+            except asyncio.CancelledError:
+                return
+            except Exception:
+                self.logging.exception(f"Task={factory!r} failed, restarting in {self._RESTART_DELAY}s")
+                await asyncio.sleep(self._RESTART_DELAY)
 
     async def start(self) -> None:
         if self._is_running:
             return
 
         self._is_running = True
+        self.loop_lag.start()
+
+        factories = []
+
+        if self._listeners:
+            if not self.scheduler:
+                self.scheduler = PollScheduler(base_interval=self._interval)
+
+            factories.append(self._poll)
+            factories.extend(functools.partial(self._consume, func, queue) for _, func, queue in self._listeners)
+
+        if self._bump_scheduler:
+            factories.append(self._bump_scheduler.run)
+
+        loop = asyncio.get_event_loop()
 
-        for listener in self._listeners.values():
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(self._run_listener(listener))
+        for factory in factories:
+            task = loop.create_task(self._run_listener(factory))
             self._tasks.add(task)
 
     async def stop(self) -> None:
@@ -122,6 +343,20 @@ class Runner(metaclass=_SingletonMeta):
 
         await asyncio.gather(*self._tasks, return_exceptions=True)
         self._tasks.clear()
+        self.loop_lag.stop()
+
+    def stats(self) -> dict:
+        """Returns poll latency, scheduler, parsing and loop lag metrics and the size of the tracked state."""
+        return {
+            "last_latency": self._latencies[-1] if self._latencies else 0.0,
+            "average_latency": sum(self._latencies) / len(self._latencies) if self._latencies else 0.0,
+            "tracked_chats": len(self._last_messages or {}),
+            "tracked_orders": len(self._saved_orders or {}),
+            **(self.scheduler.stats() if self.scheduler else {}),
+            "parsing": self.api.parse_executor.stats(),
+            "loop_lag": self.loop_lag.stats(),
+            **({"bump": self._bump_scheduler.stats()} if self._bump_scheduler else {})
+        }
 
     async def run_forever(self) -> None:
         if self._is_running:
@@ -0,0 +1,90 @@
+from typing import Optional
+import random
+
+
+class PollScheduler:
+    """Adaptive interval between ``/runner/`` polls.
+
+    Polls at ``min_interval`` right after activity, then backs off exponentially
+    up to ``max_interval`` while nothing happens. Rate limiting and server errors
+    back off further, up to ``error_max_interval``. Every delay is randomized by
+    ``jitter`` so that many accounts do not poll in lockstep.
+
+    Args:
+        min_interval (float): Floor used right after activity (seconds)
+        base_interval (float): Interval used before any activity was observed
+        max_interval (float): Ceiling while idle
+        backoff (float): Multiplier applied on every idle tick or error
+        error_max_interval (float): Ceiling after 429/5xx responses
+        jitter (float): Relative random spread of every delay (0.2 = ±20%)
+
+    Attributes:
+        interval (float): Current interval before jitter
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval: float = 3,
+        base_interval: float = 6,
+        max_interval: float = 30,
+        backoff: float = 1.5,
+        error_max_interval: float = 300,
+        jitter: float = 0.2
+    ):
+        self.min_interval = min_interval
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.error_max_interval = error_max_interval
+        self.jitter = jitter
+
+        self.interval = base_interval
+
+        self._polls = 0
+        self._active_polls = 0
+        self._errors = 0
+        self._last_delay = 0.0
+        self._total_delay = 0.0
+
+    def on_activity(self) -> None:
+        """Switches to burst mode after a poll returned new events."""
+        self._polls += 1
+        self._active_polls += 1
+        self.interval = self.min_interval
+
+    def on_idle(self) -> None:
+        """Backs off after a poll returned nothing new."""
+        self._polls += 1
+        self.interval = min(self.interval * self.backoff, self.max_interval)
+
+    def on_error(self, retry_after: Optional[float] = None) -> None:
+        """Backs off after a rate limit or server error.
+
+        Args:
+            retry_after: Delay requested by the server, takes precedence when larger
+        """
+        self._polls += 1
+        self._errors += 1
+
+        interval = min(max(self.interval, self.base_interval) * self.backoff, self.error_max_interval)
+        self.interval = max(interval, retry_after or 0)
+
+    def next_delay(self) -> float:
+        """Returns the jittered delay before the next poll."""
+        spread = self.interval * self.jitter
+        delay = max(self.interval + random.uniform(-spread, spread), self.min_interval)
+
+        self._last_delay = delay
+        self._total_delay += delay
+        return delay
+
+    def stats(self) -> dict:
+        return {
+            "interval": self.interval,
+            "last_delay": self._last_delay,
+            "average_delay": self._total_delay / self._polls if self._polls else 0.0,
+            "polls": self._polls,
+            "active_polls": self._active_polls,
+            "errors": self._errors
+        }
@@ -0,0 +1,174 @@
+from typing import TYPE_CHECKING, Iterable, Optional
+import logging
+import asyncio
+
+from funpay.http import AioHttpClient, ConnectionPool
+from funpay.executor import LoopLagMonitor
+
+if TYPE_CHECKING:
+    from funpay import FunpayAPI
+    from funpay.http import RateLimiter
+    from funpay.catalog import Catalog
+    from funpay.executor import ParseExecutor
+    from .runner import Runner
+
+
+class Supervisor:
+    """Drives the runners of many FunPay accounts on a single event loop.
+
+    All accounts added before start() share one connection pool, while each
+    account keeps its own session, cookies and response cache. Runner start
+    times are staggered across the base interval and concurrent polls can be
+    capped, so accounts are polled fairly instead of in bursts.
+
+    Args:
+        apis (Iterable[FunpayAPI]): Accounts to supervise
+        pool (Optional[ConnectionPool]): Shared connection pool. If None, a default
+            pool is created and closed on stop().
+        max_concurrent_polls (Optional[int]): Upper bound of simultaneous ``/runner/`` requests
+        limiter (Optional[RateLimiter]): Global limiter set as the parent of every account's limiter
+        catalog (Optional[Catalog]): Game/node index shared by all accounts. If None,
+            the catalog of the first added account is shared.
+        parse_executor (Optional[ParseExecutor]): Executor shared by all accounts, so
+            they parse in one pool. It is not closed on stop(). If None, every
+            account keeps its own executor.
+        stagger (float): Time span (seconds) over which runner starts are spread
+
+    Attributes:
+        loop_lag (LoopLagMonitor): Lag of the shared event loop, measured while
+            any runner is running
+    """
+
+    def __init__(
+        self,
+        apis: Iterable['FunpayAPI'] = (),
+        *,
+        pool: Optional['ConnectionPool'] = None,
+        max_concurrent_polls: Optional[int] = None,
+        limiter: Optional['RateLimiter'] = None,
+        catalog: Optional['Catalog'] = None,
+        parse_executor: Optional['ParseExecutor'] = None,
+        stagger: float = 6
+    ):
+        self.logging = logging.getLogger('funpay.Supervisor')
+
+        self.pool = pool if pool else ConnectionPool()
+        self.limiter = limiter
+        self.catalog = catalog
+        self.parse_executor = parse_executor
+        self.stagger = stagger
+        self.loop_lag = LoopLagMonitor()
+
+        self._apis = list['FunpayAPI']()
+        self._owns_pool = pool is None
+        self._poll_limiter = asyncio.Semaphore(max_concurrent_polls) if max_concurrent_polls else None
+        self._tasks = set[asyncio.Task]()
+        self._is_running = False
+        self._stop_event = asyncio.Event()
+
+        for api in apis:
+            self.add(api)
+
+    @property
+    def runners(self) -> list['Runner']:
+        return [api.get_runner() for api in self._apis]
+
+    def add(self, api: 'FunpayAPI') -> 'Runner':
+        """Adds an account and returns its runner for registering listeners."""
+        self._apis.append(api)
+
+        if self.limiter:
+            api.client.limiter.parent = self.limiter
+
+        if not self.catalog:
+            self.catalog = api.catalog
+        else:
+            api.catalog = api.bump_engine.catalog = self.catalog
+
+        if self.parse_executor:
+            api.use_parse_executor(self.parse_executor)
+
+        runner = api.get_runner()
+        runner.poll_limiter = self._poll_limiter
+        runner.loop_lag = self.loop_lag
+        return runner
+
+    async def _share_pool(self) -> None:
+        for api in self._apis:
+            if isinstance(api.client, AioHttpClient):
+                await api.client.use_pool(self.pool)
+
+    async def _start_runner(self, runner: 'Runner', delay: float) -> None:
+        await asyncio.sleep(delay)
+
+        # The runner logs in from its own loops, which are restarted after a failure
+        try:
+            await runner.start()
+        except Exception as e:
+            self.logging.error(f"Failed to start runner: {e}")
+
+    async def start(self) -> None:
+        if self._is_running:
+            return
+
+        self._is_running = True
+        await self._share_pool()
+
+        runners = self.runners
+        step = self.stagger / len(runners) if runners else 0
+
+        for index, runner in enumerate(runners):
+            task = asyncio.create_task(self._start_runner(runner, index * step))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def stop(self) -> None:
+        if not self._is_running:
+            return
+
+        self._is_running = False
+        self._stop_event.set()
+
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await asyncio.gather(*(runner.stop() for runner in self.runners))
+        await asyncio.gather(*(api.client.close() for api in self._apis))
+
+        if self._owns_pool:
+            await self.pool.close()
+
+    @staticmethod
+    def _estimate_memory(api: 'FunpayAPI') -> dict:
+        """Approximate memory (bytes) held by the state of one account."""
+        memory = {
+            "cache": api.client.cache.nbytes,
+            "chat_history": api.chat_history.nbytes,
+            "order_book": api.order_book.nbytes
+        }
+
+        return {**memory, "total": sum(memory.values())}
+
+    def stats(self) -> dict[int, dict]:
+        """Returns runner latency and memory metrics keyed by account id."""
+        return {
+            api.account.id: {
+                **api.get_runner().stats(),
+                "cache": api.client.cache.stats(),
+                "limiter": api.client.limiter.stats(),
+                "memory": self._estimate_memory(api)
+            }
+            for api in self._apis
+            if api.account
+        }
+
+    async def run_forever(self) -> None:
+        if self._is_running:
+            return
+
+        try:
+            await self.start()
+            await self._stop_event.wait()
+        except KeyboardInterrupt:
+            await self.stop()
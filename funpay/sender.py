@@ -0,0 +1,130 @@
+from typing import TYPE_CHECKING, Callable, Awaitable, Optional
+from collections import deque
+import logging
+import asyncio
+
+if TYPE_CHECKING:
+    from funpay.types import Message
+
+
+class MessageSender:
+    """Queue of outgoing chat messages: FIFO per chat, concurrent across chats.
+
+    Every chat gets its own worker that sends the chat's messages strictly in
+    the order they were queued, while at most ``concurrency`` chats are sent to
+    at the same time. With ``coalesce`` enabled, messages waiting for the same
+    chat are joined with newlines into one message (up to ``max_length``
+    characters), and all of their futures resolve to that message.
+
+    A failed send fails only the futures of that message; the chat's next
+    messages are still sent.
+
+    Args:
+        concurrency (int): Maximum number of chats sent to simultaneously
+        coalesce (bool): Join consecutive queued messages of one chat
+        max_length (int): Length limit of a coalesced message
+    """
+
+    def __init__(self, *, concurrency: int = 8, coalesce: bool = False, max_length: int = 2000):
+        self.concurrency = concurrency
+        self.coalesce = coalesce
+        self.max_length = max_length
+        self.logging = logging.getLogger('funpay.MessageSender')
+
+        self._queues: dict[int, deque[tuple[str, 'asyncio.Future']]] = {}
+        self._workers: dict[int, 'asyncio.Task'] = {}
+        self._semaphore: Optional['asyncio.Semaphore'] = None
+
+        self.sent = 0
+        self.coalesced = 0
+        self.failed = 0
+
+    def submit(
+        self,
+        chat_id: int,
+        text: str,
+        send: Callable[[str, int], Awaitable['Message']]
+    ) -> 'asyncio.Future[Message]':
+        """Queues a message and returns a future resolving to the sent message.
+
+        Args:
+            chat_id: Target chat
+            text: Message text
+            send: Coroutine function sending one text to a chat
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        chat_id = int(chat_id)
+
+        self._queues.setdefault(chat_id, deque()).append((text, future))
+
+        if chat_id not in self._workers:
+            self._workers[chat_id] = loop.create_task(self._run_chat(chat_id, send))
+
+        return future
+
+    def _take_batch(self, queue: deque[tuple[str, 'asyncio.Future']]) -> list[tuple[str, 'asyncio.Future']]:
+        batch = [queue.popleft()]
+
+        if not self.coalesce:
+            return batch
+
+        length = len(batch[0][0])
+
+        while queue and length + 1 + len(queue[0][0]) <= self.max_length:
+            length += 1 + len(queue[0][0])
+            batch.append(queue.popleft())
+
+        return batch
+
+    async def _run_chat(self, chat_id: int, send: Callable[[str, int], Awaitable['Message']]) -> None:
+        if not self._semaphore:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        queue = self._queues[chat_id]
+        futures = []
+
+        try:
+            while queue:
+                batch = self._take_batch(queue)
+                futures = [future for _, future in batch]
+
+                try:
+                    async with self._semaphore:
+                        message = await send("\n".join(text for text, _ in batch), chat_id)
+                except Exception as e:
+                    self.failed += 1
+                    self.logging.warning(f"Sending to Chat={chat_id} failed: {e}")
+
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                self.sent += 1
+                self.coalesced += len(batch) - 1
+
+                for future in futures:
+                    if not future.done():
+                        future.set_result(message)
+        except asyncio.CancelledError:
+            for future in futures + [future for _, future in queue]:
+                future.cancel()
+            raise
+        finally:
+            del self._workers[chat_id]
+            del self._queues[chat_id]
+
+    async def flush(self) -> None:
+        """Waits until every queued message has been sent (or has failed)."""
+        while self._workers:
+            await asyncio.gather(*self._workers.values(), return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "queued": sum(len(queue) for queue in self._queues.values()),
+            "active_chats": len(self._workers),
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "failed": self.failed
+        }
@@ -1,6 +1,20 @@
-from .base import BaseService
-from .reviews import ReviewsService
-from .lots import LotsService
-from .chat import ChatService
-from .orders import OrdersService
+from typing import TYPE_CHECKING
 
+from funpay.utils import lazy_attributes
+
+if TYPE_CHECKING:
+    from .base import BaseService
+    from .reviews import ReviewsService
+    from .lots import LotsService
+    from .chat import ChatService
+    from .orders import OrdersService
+
+__all__ = ["BaseService", "ReviewsService", "LotsService", "ChatService", "OrdersService"]
+
+__getattr__ = lazy_attributes(__name__, {
+    "BaseService": ".base",
+    "ReviewsService": ".reviews",
+    "LotsService": ".lots",
+    "ChatService": ".chat",
+    "OrdersService": ".orders"
+})
@@ -1,6 +1,11 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Any
+
+from funpay.enums import HtmlBackend
+from funpay.catalog import Catalog
+from funpay.executor import ParseExecutor
 
 if TYPE_CHECKING:
+    from funpay.parsers import ABCParser
     from funpay.types import Account
     from funpay.http import AioHttpClient
 
@@ -15,8 +20,27 @@ class BaseService:
     Args:
         account (Account): The authenticated user account.
         client (AioHttpClient): An async HTTP client for API requests.
+        html_backend (HtmlBackend): Tree builder passed to every HTML parser.
+        catalog (Optional[Catalog]): Shared game/node index. If None, a private one is created.
+        executor (Optional[ParseExecutor]): Where responses are parsed. If None, they are
+            parsed inline.
     """
 
-    def __init__(self, account: 'Account', client: 'AioHttpClient'):
+    def __init__(
+        self,
+        account: 'Account',
+        client: 'AioHttpClient',
+        *,
+        html_backend: 'HtmlBackend' = HtmlBackend.HTML_PARSER,
+        catalog: Optional['Catalog'] = None,
+        executor: Optional['ParseExecutor'] = None
+    ):
         self._account = account
         self.client = client
+        self._html_backend = html_backend
+        self._catalog = catalog if catalog else Catalog(client, html_backend=html_backend)
+        self._executor = executor if executor else ParseExecutor()
+
+    async def _parse(self, parser: type['ABCParser'], data: Any, **kwargs: Any) -> Any:
+        """Parses a response with the service's HTML backend on the parse executor."""
+        return await self._executor.parse(parser, data, backend=self._html_backend, **kwargs)
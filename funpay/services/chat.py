@@ -1,10 +1,15 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, AsyncIterator, Iterable
+import dataclasses
+import asyncio
 
 from funpay.parsers.json import RunnerMessageJsonParser, ChatJsonParser
+from funpay.parsers.html import FunpayChatCutsHtmlParser
+from funpay.history import ChatHistory
+from funpay.sender import MessageSender
 from .base import BaseService
 
 if TYPE_CHECKING:
-    from funpay.types import Message, Chat
+    from funpay.types import Message, Chat, ChatCut
     import datetime
 
 
@@ -14,8 +19,28 @@ class ChatService(BaseService):
     Provides functionality to:
     - Send text messages to specific chats
     - Retrieve chat message history
+    - List chats with their last messages
     - Handle chat-related operations through the platform API
+    - Incrementally sync chats, returning only messages not seen before
+    - Queue many messages with per-chat ordering
+
+    Args:
+        history (Optional[ChatHistory]): Per-chat cursors and message buffers of
+            the account. If None, a private one is created.
+        sender (Optional[MessageSender]): Outgoing message queue of the account.
+            If None, a private one is created.
     """
+    def __init__(
+        self,
+        *args,
+        history: Optional['ChatHistory'] = None,
+        sender: Optional['MessageSender'] = None,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self._history = history if history else ChatHistory()
+        self._sender = sender if sender else MessageSender()
+
     async def send_message(self, text: str, *, chat_id: str | int) -> 'Message':
         """Sends a text message to the specified chat.
 
@@ -40,13 +65,63 @@ class ChatService(BaseService):
             csrf_token=self._account.csrf_token
         )
 
-        message = RunnerMessageJsonParser(data).parse(
+        message = await self._parse(
+            RunnerMessageJsonParser,
+            data,
             locale=self._account.locale,
             author_id=self._account.id
         )
 
         return message
 
+    async def _send_text(self, text: str, chat_id: int) -> 'Message':
+        return await self.send_message(text, chat_id=chat_id)
+
+    def enqueue_message(self, text: str, *, chat_id: str | int) -> 'asyncio.Future[Message]':
+        """Queues a text message without waiting for it to be sent.
+
+        Messages to one chat are sent in the order they were queued; different
+        chats are sent to concurrently (see ``MessageSender``).
+
+        Args:
+            text: The plain text content of the message to send
+            chat_id: Unique identifier of the target chat
+
+        Returns:
+            asyncio.Future[Message]: Resolves to the sent message, or raises the
+                error the send failed with
+        """
+        return self._sender.submit(chat_id, text, self._send_text)
+
+    def send_many(self, messages: Iterable[tuple[str | int, str]]) -> 'list[asyncio.Future[Message]]':
+        """Queues many messages given as ``(chat_id, text)`` pairs.
+
+        Returns:
+            list[asyncio.Future[Message]]: One future per message, in input order
+        """
+        return [self.enqueue_message(text, chat_id=chat_id) for chat_id, text in messages]
+
+    async def flush(self) -> None:
+        """Waits until every queued message has been sent (or has failed)."""
+        await self._sender.flush()
+
+    async def list(self) -> list['ChatCut']:
+        """Retrieves the chat list with the last message of every chat.
+
+        One request covers all chats, so it is the cheap way to find chats that
+        changed: compare ``last_message.id`` with a known value (or check
+        ``unread``) and fetch the full history only for those chats.
+
+        Returns:
+            list[ChatCut]: Chats in the order FunPay lists them (most recent first)
+
+        Raises:
+            HttpRequestError: For API communication failures (status >= 400)
+            ParserError: When critical HTML parsing fails
+        """
+        html = await self.client.request.fetch_chat_page()
+        return await self._parse(FunpayChatCutsHtmlParser, html)
+
     async def get_history(
         self,
         chat_id: int,
@@ -82,10 +157,165 @@ class ChatService(BaseService):
         if not data:
             return
 
-        chat = ChatJsonParser(data).parse(
+        chat = await self._parse(
+            ChatJsonParser,
+            data,
             locale=self._account.locale,
             since_date=since_date
         )
 
         return chat
 
+    async def sync(self, chat_id: int) -> 'list[Message]':
+        """Fetches the messages of a chat that were not returned before.
+
+        The id of the newest seen message is kept per chat. Messages at or below
+        it are skipped before their HTML is parsed, and older pages are only
+        requested while the gap to that message is not closed (at most as many
+        messages as the history buffer holds). New messages are appended to the
+        chat's ring buffer in ``ChatHistory``.
+
+        Args:
+            chat_id: Numeric identifier of the target chat
+
+        Returns:
+            list[Message]: New messages, oldest first (empty if nothing changed)
+
+        Raises:
+            HttpRequestError: For API communication failures (status >= 400)
+            ParserError: When critical HTML parsing fails
+        """
+        cursor = self._history.cursor(chat_id)
+        data = await self.client.request.fetch_chat_history(
+            chat_id=chat_id,
+            last_message=99999999999999999
+        )
+
+        if not data:
+            return []
+
+        raw_messages = data.get('messages') or []
+
+        while cursor and raw_messages and len(raw_messages) < self._history.maxlen:
+            oldest_id = min(int(raw_message['id']) for raw_message in raw_messages)
+
+            if oldest_id <= cursor:
+                break
+
+            older = await self.client.request.fetch_chat_history(chat_id=chat_id, last_message=oldest_id)
+            older_messages = [
+                raw_message for raw_message in (older or {}).get('messages') or []
+                if int(raw_message['id']) < oldest_id
+            ]
+
+            if not older_messages:
+                break
+
+            raw_messages = older_messages + raw_messages
+
+        last_message = self._history.last_message(chat_id)
+        chat = await self._parse(
+            ChatJsonParser,
+            {**data, 'messages': raw_messages},
+            locale=self._account.locale,
+            after_message_id=cursor if last_message else None,
+            author=last_message.author if last_message else None,
+            date=last_message.date if last_message else None
+        )
+
+        if not chat:
+            return []
+
+        return self._history.merge(chat_id, chat.messages)
+
+    async def _fetch_history_page(self, chat_id: int, before_message_id: int) -> Optional[dict]:
+        data = await self.client.request.fetch_chat_history(chat_id=chat_id, last_message=before_message_id)
+
+        if not data:
+            return
+
+        messages = [
+            raw_message for raw_message in data.get('messages') or []
+            if int(raw_message['id']) < before_message_id
+        ]
+
+        return {**data, 'messages': messages}
+
+    async def iter_history(
+        self,
+        chat_id: int,
+        *,
+        since_date: Optional['datetime.datetime'] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator['Message']:
+        """Walks the whole chat history backwards, newest message first.
+
+        Pages are requested one after another by message id, so only one page
+        (plus the prefetched one) is kept in memory however long the chat is.
+        Messages that continue an author's series at the start of a page get
+        their author and date from the next (older) page before being yielded.
+
+        Args:
+            chat_id: Numeric identifier of the target chat
+            since_date: Stop at the first message older than this date. Pages
+                past the boundary are not requested.
+            prefetch: Request the next page while the current one is consumed
+
+        Yields:
+            Message: Chat messages from newest to oldest
+
+        Raises:
+            HttpRequestError: For API communication failures (status >= 400)
+            ParserError: When critical HTML parsing fails
+        """
+        pending = asyncio.ensure_future(self._fetch_history_page(chat_id, 99999999999999999))
+        held = list['Message']()
+
+        try:
+            while pending:
+                data = await pending
+                pending = None
+
+                if not data or not data['messages']:
+                    break
+
+                chat = await self._parse(ChatJsonParser, data, locale=self._account.locale)
+                messages = chat.messages if chat else []
+
+                if held and messages and messages[-1].author:
+                    resolved = [
+                        dataclasses.replace(message, author=messages[-1].author, date=messages[-1].date)
+                        for message in held
+                    ]
+                    held = []
+
+                    for message in reversed(resolved):
+                        if since_date and message.date < since_date:
+                            return
+
+                        yield message
+
+                index = next((i for i, message in enumerate(messages) if message.author), len(messages))
+                held = messages[:index] + held
+                messages = messages[index:]
+
+                if not (since_date and messages and messages[0].date < since_date):
+                    oldest_id = min(int(raw_message['id']) for raw_message in data['messages'])
+                    pending = self._fetch_history_page(chat_id, oldest_id)
+
+                    if prefetch:
+                        pending = asyncio.ensure_future(pending)
+
+                for message in reversed(messages):
+                    if since_date and message.date < since_date:
+                        return
+
+                    yield message
+
+            for message in reversed(held):
+                yield message
+        finally:
+            if isinstance(pending, asyncio.Future):
+                pending.cancel()
+            elif pending:
+                pending.close()
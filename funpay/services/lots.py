@@ -1,13 +1,11 @@
 from typing import TYPE_CHECKING, Optional
 
-import asyncio
-
-from funpay.parsers.html import FunpayUserLotsHtmlParser, FunpayGamesHtmlParser
-from funpay.parsers.json import RaiseNodeJsonParser
+from funpay.parsers.html import FunpayUserLotsHtmlParser
+from funpay.bump import BumpEngine
 from .base import BaseService
 
 if TYPE_CHECKING:
-    from funpay.types import Lot, RaiseNode, Game
+    from funpay.types import Lot, RaiseNode
 
 
 class LotsService(BaseService):
@@ -17,7 +15,15 @@ class LotsService(BaseService):
     - Retrieve current user's lots
     - Perform lot bumping (up) operations
     - Track operation statuses
+
+    Args:
+        bump_engine (Optional[BumpEngine]): Engine keeping the raise cooldowns of the
+            account. If None, a private one is created.
     """
+    def __init__(self, *args, bump_engine: Optional['BumpEngine'] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._bump_engine = bump_engine if bump_engine else BumpEngine(self.client, self._catalog)
+
     async def all(self, *, node_id: Optional[int] = None) -> list['Lot']:
         """Retrieves all active lots for the authenticated user.
 
@@ -36,7 +42,7 @@ class LotsService(BaseService):
 
         """
         html = await self.client.request.fetch_users_page(self._account.id)
-        lots = FunpayUserLotsHtmlParser(html).parse(node_id=node_id)
+        lots = await self._parse(FunpayUserLotsHtmlParser, html, node_id=node_id)
 
         return lots
 
@@ -64,28 +70,17 @@ class LotsService(BaseService):
             None
         )
 
-    async def _get_game_from_node_id(self, node_id: int) -> 'Game':
-        """Returns the Game containing the specified node_id with O(n) complexity."""
-
-        html = await self.client.request.fetch_main_page()
-        games = FunpayGamesHtmlParser(html).parse()
-
-        return next(
-            (game for game in games
-             if any(node.id == node_id for node in game.nodes)),
-            None
-        )
-
     async def up(self) -> list['RaiseNode']:
         """Executes bulk bump/raise operation for all eligible marketplace listings.
 
-        Performs complete bump workflow for each active listing:
-        1. Node verification and game_id extraction
-        2. API request submission
-        3. Result parsing and validation
+        Performs complete bump workflow for every node with active listings:
+        1. Grouping of listings by node (one raise request per node)
+        2. Skipping nodes whose raise cooldown is not over yet
+        3. API request submission with game_id taken from the catalog
+        4. Result parsing and cooldown bookkeeping
 
         Returns:
-            List of RaiseNode objects containing operation results
+            List of RaiseNode objects, one per node (skipped nodes included)
 
         Raises:
             HttpRequestError: For API communication failures (status >= 400)
@@ -95,18 +90,5 @@ class LotsService(BaseService):
             - Operations are executed concurrently using asyncio.gather
         """
 
-        async def process_node_up(lot: 'Lot') -> 'RaiseNode':
-            game = await self._get_game_from_node_id(lot.node.id)
-            data = await self.client.request.send_raise(
-                game_id=game.id,
-                node_id=lot.node.id
-            )
-
-            return RaiseNodeJsonParser(data).parse(node=lot.node)
-
-        results = await asyncio.gather(*[
-            process_node_up(lot)
-            for lot in await self.all()
-        ])
-
-        return results
+        lots = await self.all()
+        return await self._bump_engine.raise_nodes(lot.node for lot in lots)
@@ -1,11 +1,25 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, AsyncIterator, Iterable
+import asyncio
 
-from funpay.enums import OrderType
-from funpay.parsers.html import FunpayOrdersCutHtmlParser, FunpayOrderHtmlParser
+from funpay.enums import OrderType, ParseMode
+from funpay.parsers.html import FunpayOrderHtmlParser, FunpayOrdersCutHtmlParser
+from funpay.order_book import OrderBook
 from .base import BaseService
 
 if TYPE_CHECKING:
     from funpay.types import Order, OrderCut
+    from funpay.enums import StatusOrder, HtmlBackend, Locale
+    import datetime
+
+
+def _parse_orders_page(
+    html: str,
+    backend: 'HtmlBackend',
+    locale: 'Locale',
+    order_type: 'OrderType'
+) -> tuple[list['OrderCut'], Optional[str]]:
+    parser = FunpayOrdersCutHtmlParser(html, backend=backend)
+    return parser.parse(locale=locale, order_type=order_type), parser.continue_token()
 
 
 class OrdersService(BaseService):
@@ -16,36 +30,211 @@ class OrdersService(BaseService):
     - Get detailed information about specific orders
     - Process order refunds and cancellations
     - Handle order-related operations through the platform API
+
+    Order lists are kept in an ``OrderBook``: every call parses only the rows
+    that are new or changed since the previous one.
+
+    Args:
+        order_book (Optional[OrderBook]): Order index of the account. If None,
+            a private one is created.
     """
-    async def sales(self) -> list['OrderCut']:
-        """Retrieves a list of the user's sales orders from FunPay.
+    def __init__(self, *args, order_book: Optional['OrderBook'] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._order_book = order_book if order_book is not None else OrderBook(
+            html_backend=self._html_backend,
+            executor=self._executor
+        )
+
+    async def sync_sales(self, *, full: bool = False) -> list['OrderCut']:
+        """Merges the sales page into the order book.
+
+        Args:
+            full: Re-parse every row, also known orders whose status did not change
 
         Returns:
-            list[OrderCut]: A list of simplified order objects representing sales.
+            list[OrderCut]: New sales and sales whose status changed, newest first
         """
         html = await self.client.request.fetch_sales_page()
+        return await self._order_book.update(html, self._account.locale, OrderType.SALE, full=full)
 
-        orders = FunpayOrdersCutHtmlParser(html).parse(
-            locale=self._account.locale,
-            order_type=OrderType.SALE
-        )
+    async def sync_purchases(self, *, full: bool = False) -> list['OrderCut']:
+        """Merges the purchases page into the order book.
+
+        Args:
+            full: Re-parse every row, also known orders whose status did not change
+
+        Returns:
+            list[OrderCut]: New purchases and purchases whose status changed, newest first
+        """
+        html = await self.client.request.fetch_purchases_page()
+        return await self._order_book.update(html, self._account.locale, OrderType.PURCHASE, full=full)
 
-        return orders
+    def changed_since(self, cursor: int = 0) -> tuple[list['OrderCut'], int]:
+        """Returns the orders changed after ``cursor`` and the new cursor.
+
+        Only reads the order book; call ``sync_sales``/``sync_purchases`` to
+        pull the pages first.
+
+        Args:
+            cursor: Value returned by the previous call (0 for every known order)
+
+        Returns:
+            tuple[list[OrderCut], int]: Changed orders (oldest change first) and
+                the cursor to pass next time
+        """
+        return self._order_book.changed_since(cursor)
+
+    async def sales(self) -> list['OrderCut']:
+        """Retrieves a list of the user's sales orders from FunPay.
+
+        Syncs the first sales page into the account's order book and returns
+        every sale accumulated in the book, not only the rows of the current
+        page. Statuses of the orders on the first page are current; orders that
+        have dropped off it keep the status they had when last seen there. Use
+        ``iter_sales()`` to walk the full history from FunPay.
+
+        Returns:
+            list[OrderCut]: A list of simplified order objects representing sales, newest first.
+        """
+        await self.sync_sales()
+        return self._order_book.orders(OrderType.SALE)
 
     async def purchases(self) -> list['OrderCut']:
         """Retrieves a list of the user's purchase orders from FunPay.
 
+        Syncs the first purchases page into the account's order book and returns
+        every purchase accumulated in the book, not only the rows of the current
+        page. Statuses of the orders on the first page are current; orders that
+        have dropped off it keep the status they had when last seen there. Use
+        ``iter_purchases()`` to walk the full history from FunPay.
+
         Returns:
-            list[OrderCut]: A list of simplified order objects representing purchases.
+            list[OrderCut]: A list of simplified order objects representing purchases, newest first.
         """
-        html = await self.client.request.fetch_purchases_page()
+        await self.sync_purchases()
+        return self._order_book.orders(OrderType.PURCHASE)
+
+    async def _iter_orders(
+        self,
+        order_type: 'OrderType',
+        *,
+        status: Optional['StatusOrder'] = None,
+        since: Optional['datetime.datetime'] = None,
+        until: Optional['datetime.datetime'] = None,
+        user_id: Optional[int] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator['OrderCut']:
+        if order_type == OrderType.SALE:
+            url, first_page = "/orders/trade", self.client.request.fetch_sales_page()
+        else:
+            url, first_page = "/orders/", self.client.request.fetch_purchases_page()
+
+        pending = asyncio.ensure_future(first_page)
+        seen_tokens = set[str]()
 
-        orders = FunpayOrdersCutHtmlParser(html).parse(
-            locale=self._account.locale,
-            order_type=OrderType.PURCHASE
+        try:
+            while pending:
+                html = await pending
+                pending = None
+
+                orders, token = await self._executor.call(
+                    _parse_orders_page,
+                    html,
+                    self._html_backend,
+                    self._account.locale,
+                    order_type
+                )
+
+                if token and token not in seen_tokens and not (since and orders and orders[-1].start_date < since):
+                    seen_tokens.add(token)
+                    pending = self.client.request.fetch_more_orders(url, token)
+
+                    if prefetch:
+                        pending = asyncio.ensure_future(pending)
+
+                for order in orders:
+                    if since and order.start_date < since:
+                        return
+
+                    if until and order.start_date > until:
+                        continue
+
+                    if status is not None and order.status != status:
+                        continue
+
+                    if user_id is not None and order.user.id != user_id:
+                        continue
+
+                    yield order
+        finally:
+            if isinstance(pending, asyncio.Future):
+                pending.cancel()
+            elif pending:
+                pending.close()
+
+    def iter_sales(
+        self,
+        *,
+        status: Optional['StatusOrder'] = None,
+        since: Optional['datetime.datetime'] = None,
+        until: Optional['datetime.datetime'] = None,
+        user_id: Optional[int] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator['OrderCut']:
+        """Walks the whole sales history, newest first, page by page.
+
+        Pages are followed through FunPay's ``continue`` token and every order
+        is yielded as soon as its page is parsed, so only one page (plus the
+        prefetched one) is kept in memory.
+
+        Args:
+            status: Yield only orders with this status
+            since: Stop at the first order opened before this date; older pages
+                are not requested
+            until: Skip orders opened after this date
+            user_id: Yield only orders of this buyer
+            prefetch: Request the next page while the current one is consumed
+
+        Yields:
+            OrderCut: Sales from newest to oldest
+
+        Raises:
+            HttpRequestError: For API communication failures (status >= 400)
+            ParserError: When critical HTML parsing fails
+        """
+        return self._iter_orders(
+            OrderType.SALE,
+            status=status,
+            since=since,
+            until=until,
+            user_id=user_id,
+            prefetch=prefetch
         )
 
-        return orders
+    def iter_purchases(
+        self,
+        *,
+        status: Optional['StatusOrder'] = None,
+        since: Optional['datetime.datetime'] = None,
+        until: Optional['datetime.datetime'] = None,
+        user_id: Optional[int] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator['OrderCut']:
+        """Walks the whole purchases history, newest first, page by page.
+
+        Works like ``iter_sales``; ``user_id`` filters by seller.
+
+        Yields:
+            OrderCut: Purchases from newest to oldest
+        """
+        return self._iter_orders(
+            OrderType.PURCHASE,
+            status=status,
+            since=since,
+            until=until,
+            user_id=user_id,
+            prefetch=prefetch
+        )
 
     async def get(self, order_code: str) -> 'Order':
         """Retrieves detailed information about a specific order.
@@ -57,9 +246,51 @@ class OrdersService(BaseService):
             Order: A complete order object with all available details.
         """
         html = await self.client.request.fetch_order_page(order_code)
-        order = FunpayOrderHtmlParser(html).parse(locale=self._account.locale)
+        order = await self._parse(FunpayOrderHtmlParser, html, locale=self._account.locale)
         return order
 
+    async def get_many(self, order_codes: Iterable[str], *, concurrency: int = 8) -> AsyncIterator['Order']:
+        """Retrieves many orders concurrently, yielding them as they complete.
+
+        Duplicate codes are fetched once. At most ``concurrency`` order pages are
+        requested at the same time, pages are parsed on the parse executor (in
+        worker threads when it runs inline) so the event loop keeps serving
+        other tasks, and already fetched pages come from the client's response
+        cache.
+
+        Args:
+            order_codes: Codes of the orders (with or without the leading "#")
+            concurrency: Maximum number of simultaneous order page requests
+
+        Yields:
+            Order: Complete order objects in completion order
+
+        Raises:
+            HttpRequestError: For API communication failures (status >= 400)
+            ParserError: When critical HTML parsing fails
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _get(order_code: str) -> 'Order':
+            async with semaphore:
+                html = await self.client.request.fetch_order_page(order_code)
+
+            if self._executor.mode == ParseMode.INLINE:
+                parser = FunpayOrderHtmlParser(html, backend=self._html_backend)
+                return await asyncio.to_thread(parser.parse, locale=self._account.locale)
+
+            return await self._parse(FunpayOrderHtmlParser, html, locale=self._account.locale)
+
+        codes = dict.fromkeys(order_code.lstrip('#') for order_code in order_codes)
+        tasks = [asyncio.ensure_future(_get(order_code)) for order_code in codes]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def refund(self, order_code: str) -> None:
         """Initiates a refund process for the specified order.
 
@@ -76,3 +307,6 @@ class OrdersService(BaseService):
             order_code=order_code,
             csrf_token=self._account.csrf_token
         )
+
+        self.client.cache.invalidate("fetch_order_page", order_code)
+        self.client.cache.invalidate("fetch_sales_page")
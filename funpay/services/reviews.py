@@ -1,10 +1,13 @@
 from typing import TYPE_CHECKING, Optional, Literal
+import logging
 
-from funpay.parsers.html import FunpayUserReviewsHtmlParser, ReviewHtmlParser
+from funpay.http.exceptions import HttpRequestError, NetworkError, CircuitOpenError
+from funpay.parsers.exceptions import ParseError
+from funpay.parsers.html import FunpayUserReviewsHtmlParser, ReviewHtmlParser, FunpayOrderHtmlParser
 from .base import BaseService
 
 if TYPE_CHECKING:
-    from funpay.types import Review
+    from funpay.types import Review, Order
 
 
 class ReviewsService(BaseService):
@@ -16,6 +19,31 @@ class ReviewsService(BaseService):
     - Review deletion (WIP)
     - Review analysis and statistics
     """
+    async def _get_order(self, order_code: str) -> Optional['Order']:
+        """Returns the reviewed order (usually from the cached order page), or None if it cannot be read."""
+        try:
+            html = await self.client.request.fetch_order_page(order_code)
+            return await self._parse(FunpayOrderHtmlParser, html, locale=self._account.locale)
+        except (HttpRequestError, NetworkError, CircuitOpenError, ParseError) as e:
+            logging.getLogger('funpay.ReviewsService').warning(f"Order={order_code} could not be read: {e}")
+            return None
+
+    async def _invalidate_review_pages(self, order_code: str) -> None:
+        """Drops cached pages that display the review of the given order.
+
+        The review is shown on the order page and on the profiles of both the
+        account and the other party of the order. The other party is looked up
+        on a best-effort basis; the account's profile and the order page are
+        dropped even if the order cannot be read.
+        """
+        order = await self._get_order(order_code)
+
+        self.client.cache.invalidate("fetch_users_page", self._account.id)
+        self.client.cache.invalidate("fetch_order_page", order_code)
+
+        if order and order.user and order.user.id is not None:
+            self.client.cache.invalidate("fetch_users_page", order.user.id)
+
     async def all(self, *, only_user_id: Optional[int] = None) -> list['Review']:
         """Retrieves reviews with optional username filtering.
 
@@ -36,7 +64,7 @@ class ReviewsService(BaseService):
         """
 
         html = await self.client.request.fetch_users_page(self._account.id)
-        reviews = FunpayUserReviewsHtmlParser(html).parse(only_user_id=only_user_id)
+        reviews = await self._parse(FunpayUserReviewsHtmlParser, html, only_user_id=only_user_id)
 
         return reviews
 
@@ -94,8 +122,9 @@ class ReviewsService(BaseService):
             rating=rating,
             csrf_token=self._account.csrf_token
         )
+        await self._invalidate_review_pages(order_code)
 
-        review = ReviewHtmlParser(html).parse()
+        review = await self._parse(ReviewHtmlParser, html)
         return review
 
     async def delete(self, *, order_code: str) -> bool:
@@ -120,5 +149,6 @@ class ReviewsService(BaseService):
             order_code=order_code,
             csrf_token=self._account.csrf_token
         )
+        await self._invalidate_review_pages(order_code)
 
         return True
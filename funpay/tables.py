@@ -0,0 +1,166 @@
+from typing import Iterable, Iterator, Optional
+from array import array
+import datetime
+import math
+import sys
+
+from funpay.enums import StatusOrder, OrderType
+from funpay.types import OrderCut, Message, UserCut
+
+
+class _Table:
+    """Column storage shared by the bulk tables.
+
+    Numbers live in ``array`` columns, repeated strings are interned and equal
+    ``UserCut`` objects are stored once, so a row costs a few machine words
+    instead of a set of Python objects. Dates are kept as POSIX timestamps
+    with the UTC offset in seconds (naive dates are read as UTC and restored
+    naive, aware dates are restored with a fixed offset timezone).
+    """
+
+    _NAIVE = -2 ** 31
+
+    def __init__(self):
+        self._users: dict[tuple[Optional[int], Optional[str]], 'UserCut'] = {}
+        self._timezones: dict[int, 'datetime.timezone'] = {0: datetime.timezone.utc}
+
+        self._dates = array('d')
+        self._offsets = array('i')
+
+    def _share_user(self, user: Optional['UserCut']) -> Optional['UserCut']:
+        if user is None:
+            return None
+
+        return self._users.setdefault((user.id, user.username), user)
+
+    def _append_date(self, date: Optional['datetime.datetime']) -> None:
+        if date is None:
+            self._dates.append(math.nan)
+            self._offsets.append(self._NAIVE)
+        elif date.tzinfo is None:
+            self._dates.append(date.replace(tzinfo=datetime.timezone.utc).timestamp())
+            self._offsets.append(self._NAIVE)
+        else:
+            self._dates.append(date.timestamp())
+            self._offsets.append(int(date.utcoffset().total_seconds()))
+
+    def _get_timezone(self, offset: int) -> 'datetime.timezone':
+        timezone = self._timezones.get(offset)
+
+        if timezone is None:
+            timezone = self._timezones[offset] = datetime.timezone(datetime.timedelta(seconds=offset))
+
+        return timezone
+
+    def _get_date(self, index: int) -> Optional['datetime.datetime']:
+        timestamp = self._dates[index]
+
+        if math.isnan(timestamp):
+            return None
+
+        offset = self._offsets[index]
+
+        if offset == self._NAIVE:
+            return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc).replace(tzinfo=None)
+
+        return datetime.datetime.fromtimestamp(timestamp, tz=self._get_timezone(offset))
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+
+class OrderTable(_Table):
+    """Columnar collection of ``OrderCut`` rows for large bulk results.
+
+    Rows are materialized into ``OrderCut`` objects only when accessed.
+
+    Args:
+        orders (Iterable[OrderCut]): Initial rows
+    """
+
+    def __init__(self, orders: Iterable['OrderCut'] = ()):
+        super().__init__()
+
+        self.ids = list[str]()
+        self.titles = list[str]()
+        self.statuses = array('b')
+        self.prices = array('d')
+        self.order_types = array('b')
+        self.users = list[Optional['UserCut']]()
+
+        self.extend(orders)
+
+    def append(self, order: 'OrderCut') -> None:
+        self.ids.append(order.id)
+        self.titles.append(sys.intern(order.title) if order.title else order.title)
+        self.statuses.append(-1 if order.status is None else order.status)
+        self.prices.append(order.price)
+        self._append_date(order.start_date)
+        self.order_types.append(-1 if order.order_type is None else order.order_type)
+        self.users.append(self._share_user(order.user))
+
+    def extend(self, orders: Iterable['OrderCut']) -> None:
+        for order in orders:
+            self.append(order)
+
+    def __getitem__(self, index: int) -> 'OrderCut':
+        status = self.statuses[index]
+        order_type = self.order_types[index]
+
+        return OrderCut(
+            id=self.ids[index],
+            title=self.titles[index],
+            status=None if status == -1 else StatusOrder(status),
+            price=self.prices[index],
+            start_date=self._get_date(index),
+            order_type=None if order_type == -1 else OrderType(order_type),
+            user=self.users[index]
+        )
+
+    def __iter__(self) -> Iterator['OrderCut']:
+        for index in range(len(self)):
+            yield self[index]
+
+
+class MessageTable(_Table):
+    """Columnar collection of ``Message`` rows for large bulk results.
+
+    Rows are materialized into ``Message`` objects only when accessed.
+
+    Args:
+        messages (Iterable[Message]): Initial rows
+    """
+
+    def __init__(self, messages: Iterable['Message'] = ()):
+        super().__init__()
+
+        self.ids = array('q')
+        self.chat_ids = array('q')
+        self.contents = list[str]()
+        self.authors = list[Optional['UserCut']]()
+
+        self.extend(messages)
+
+    def append(self, message: 'Message') -> None:
+        self.ids.append(message.id)
+        self.chat_ids.append(message.chat_id)
+        self.contents.append(message.content)
+        self.authors.append(self._share_user(message.author))
+        self._append_date(message.date)
+
+    def extend(self, messages: Iterable['Message']) -> None:
+        for message in messages:
+            self.append(message)
+
+    def __getitem__(self, index: int) -> 'Message':
+        return Message(
+            id=self.ids[index],
+            chat_id=self.chat_ids[index],
+            content=self.contents[index],
+            author=self.authors[index],
+            date=self._get_date(index)
+        )
+
+    def __iter__(self) -> Iterator['Message']:
+        for index in range(len(self)):
+            yield self[index]
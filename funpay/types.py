@@ -1,35 +1,40 @@
 from typing import Optional, TYPE_CHECKING
 from dataclasses import dataclass
+import sys
 
 if TYPE_CHECKING:
     from funpay.enums import Locale, StatusOrder, OrderType
     import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserCut:
     id: Optional[int]
     username: Optional[str]
 
+    def __post_init__(self):
+        if self.username:
+            object.__setattr__(self, 'username', sys.intern(self.username))
+
     def __str__(self):
         return self.username
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class User(UserCut):
     created_date: 'datetime.datetime'
     banned: bool
     last_online: Optional['datetime.datetime']
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Account(UserCut):
     csrf_token: str
     locale: 'Locale'
     balance: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Lot:
     id: int
     node: 'Node'
@@ -41,27 +46,32 @@ class Lot:
         return self.title
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RaiseNode:
     node: 'Node'
     message: str
     success: bool
+    cooldown: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Node:
     id: int
     name: str
 
+    def __post_init__(self):
+        if self.name:
+            object.__setattr__(self, 'name', sys.intern(self.name))
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Game:
     id: int
     name: str
     nodes: list['Node']
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Review:
     user: 'UserCut'
     order_code: str
@@ -72,7 +82,7 @@ class Review:
         return f"{self.user}: {self.text}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Message:
     id: int
     chat_id: int
@@ -84,21 +94,22 @@ class Message:
         return self.content
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Chat:
     id: int
     interlocutor_id: str
     messages: list['Message']
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChatCut:
     id: int
     interlocutor_id: str
     last_message: 'Message'
+    unread: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderCut:
     id: str
     title: str
@@ -109,7 +120,7 @@ class OrderCut:
     user: 'UserCut'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Order(OrderCut):
     end_date: 'datetime.datetime'
     description: str
@@ -1,11 +1,35 @@
+from typing import Any, Callable
+import importlib
 import string
 import random
 import datetime
+import sys
 import re
 
 from funpay.enums import Locale, StatusOrder
 
 
+def lazy_attributes(package: str, attributes: dict[str, str]) -> Callable[[str], Any]:
+    """Builds a module ``__getattr__`` (PEP 562) that imports attributes on first access.
+
+    Args:
+        package: Name of the package the attributes belong to (``__name__``)
+        attributes: Mapping of attribute name to the relative module defining it
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = attributes.get(name)
+
+        if not module_name:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
+
+
 def random_tag() -> str:
     return "".join(random.choice(string.digits + string.ascii_lowercase) for _ in range(10))
 
@@ -109,3 +133,40 @@ def get_order_status_from_string(locale: 'Locale', status_string: str):
 
     status = statuses.get(status_string)
     return status
+
+
+def get_cooldown_from_string(message: str) -> int | None:
+    """Extracts the raise cooldown in seconds from a FunPay message.
+
+    Examples: "Подождите 3 часа.", "Подождите минуту.", "Please wait 45 minutes.",
+    "Подождите 1 час 30 минут." (all amounts are summed)
+
+    Returns:
+        int | None: Cooldown in seconds or None if the message contains no wait time
+    """
+    if not message:
+        return None
+
+    pattern = r"""
+        (\d+)?                    # Optional amount (a bare unit means 1)
+        \s*                        # Optional whitespace
+        (?<![a-zа-яё])            # Unit starts a word ("администратор" is not "мин")
+        (сек(?:унд[аыу]?)?|мин(?:ут[аыу]?)?|час(?:а|ов)?|seconds?|minutes?|hours?)
+        (?![a-zа-яё])             # ...and ends it
+    """
+
+    matches = re.findall(pattern, message.lower(), re.VERBOSE)
+
+    if not matches:
+        return None
+
+    seconds = {
+        "с": 1,
+        "м": 60,
+        "ч": 3600,
+        "s": 1,
+        "m": 60,
+        "h": 3600
+    }
+
+    return sum(int(amount or 1) * seconds[unit[0]] for amount, unit in matches)